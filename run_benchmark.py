@@ -16,7 +16,8 @@ import sys
 # Add src to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.benchmark import BenchmarkRunner
+from src.algorithms import ALGORITHMS, PROCESS_POOL_ALGORITHMS
+from src.benchmark import BenchmarkRunner, RepetitionSettings
 
 
 def get_instance_id() -> str:
@@ -51,6 +52,27 @@ Examples:
     # Run only preset benchmarks
     python run_benchmark.py --algorithm memoization --presets-only
     
+    # Solve every start row in one job per preset matrix
+    python run_benchmark.py --algorithm tabulation --presets-only --all-starts
+    
+    # Reuse a warm worker process (no spawn cost in the timings)
+    python run_benchmark.py --algorithm tabulation --presets-only --warm-workers
+    
+    # Repeat each job until the median is stable (implies --warm-workers)
+    python run_benchmark.py --algorithm tabulation --presets-only --repeat
+    
+    # Per-call time of microsecond-scale runs (in-process loop)
+    python run_benchmark.py --algorithm tabulation --complexity-only --sizes 5 10 20 --autorange
+    
+    # Resume after the instance/container died (same --output directory)
+    python run_benchmark.py --algorithm brute_force --resume
+    
+    # Stop starting runs once the whole benchmark could exceed 2 hours
+    python run_benchmark.py --algorithm brute_force --budget 7200
+    
+    # Fitted runtime models for timeouts, skipping and ETA (refined every run)
+    python run_benchmark.py --algorithm brute_force --runtime-model ./results/runtime_models.json
+    
     # Custom timeout for slow algorithms
     python run_benchmark.py --algorithm backtracking --timeout 600
         """
@@ -59,7 +81,7 @@ Examples:
     parser.add_argument(
         "--algorithm", "-a",
         required=True,
-        choices=["brute_force", "backtracking", "divide_and_conquer", "memoization", "tabulation"],
+        choices=list(ALGORITHMS.keys()),
         help="Algorithm to benchmark"
     )
     
@@ -81,6 +103,12 @@ Examples:
         help="Run only preset matrix benchmarks"
     )
     
+    parser.add_argument(
+        "--all-starts",
+        action="store_true",
+        help="Preset benchmarks solve every start row of column 0 as a single job"
+    )
+    
     parser.add_argument(
         "--sizes",
         type=int,
@@ -103,6 +131,113 @@ Examples:
         help="Directory with pre-generated test matrices (enables reproducibility)"
     )
     
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=None,
+        help="Columns between stored cost columns for vectorized_checkpoint "
+             "(memory/compute trade-off; default ~sqrt(8n))"
+    )
+    
+    parser.add_argument(
+        "--warm-workers",
+        action="store_true",
+        help="Reuse a pre-started worker process for every run instead of "
+             "spawning one per run (removes process startup from the timings)"
+    )
+    
+    parser.add_argument(
+        "--separate-memory-run",
+        action="store_true",
+        help="Time the algorithm without tracemalloc and measure peak memory "
+             "in a second, traced call"
+    )
+    
+    parser.add_argument(
+        "--autorange",
+        action="store_true",
+        help="Time in-process, timeit-style: call the algorithm in a loop "
+             "(GC disabled) and record the per-call time; timeouts via SIGALRM"
+    )
+    
+    parser.add_argument(
+        "--autorange-min-seconds",
+        type=float,
+        default=0.2,
+        help="Minimum duration of the --autorange loop (default: 0.2)"
+    )
+    
+    parser.add_argument(
+        "--memory-sample-interval",
+        type=float,
+        default=None,
+        help="Sample the child's RSS every N seconds while waiting for it "
+             "(stored as memory_timeline; e.g. 0.01)"
+    )
+    
+    parser.add_argument(
+        "--repeat",
+        action="store_true",
+        help="Repeat every job (warm-up + interleaved samples) until the median "
+             "is stable; stores median, IQR, min and the raw samples. "
+             "Implies --warm-workers (unless --autorange)"
+    )
+    
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Discarded warm-up runs per job in --repeat mode (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--target-ci",
+        type=float,
+        default=0.05,
+        help="Stop repeating once the 95%% CI half-width of the median is below "
+             "this fraction of the median (default: 0.05)"
+    )
+    
+    parser.add_argument(
+        "--max-samples",
+        type=int,
+        default=50,
+        help="Maximum timed samples per job in --repeat mode (default: 50)"
+    )
+    
+    parser.add_argument(
+        "--job-budget",
+        type=float,
+        default=30.0,
+        help="Wall-clock seconds per job in --repeat mode (default: 30)"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted run: load the result journal in --output "
+             "and skip its completed (algorithm, matrix, start) jobs"
+    )
+    
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="Global wall-clock budget in seconds for the whole run: a job is "
+             "only started if its adaptive timeout still fits, otherwise it is "
+             "recorded as skipped (default: no budget)"
+    )
+    
+    parser.add_argument(
+        "--runtime-model",
+        default=None,
+        metavar="PATH",
+        help="JSON file of per-algorithm runtime models fitted from past runs: "
+             "replaces the adaptive timeout steps, skips jobs predicted far "
+             "beyond the per-run cap and prints ETAs; updated after every run "
+             "(default: adaptive timeout steps)"
+    )
+    
     parser.add_argument(
         "--format", "-f",
         choices=["json", "csv"],
@@ -116,12 +251,35 @@ Examples:
     if args.complexity_only and args.presets_only:
         parser.error("Cannot use both --complexity-only and --presets-only")
     
+    algorithm_options = {}
+    if args.checkpoint_interval is not None:
+        if args.algorithm != "vectorized_checkpoint":
+            parser.error("--checkpoint-interval only applies to vectorized_checkpoint")
+        algorithm_options["interval"] = args.checkpoint_interval
+    
+    if args.autorange and args.algorithm in PROCESS_POOL_ALGORITHMS:
+        parser.error(f"--autorange cannot time out {args.algorithm} (it runs in a "
+                     f"process pool); drop --autorange")
+    
+    repetition = None
+    if args.repeat:
+        repetition = RepetitionSettings(
+            warmup=args.warmup,
+            target_relative_ci=args.target_ci,
+            max_samples=args.max_samples,
+            job_budget_seconds=args.job_budget
+        )
+    
     # Get instance ID
     instance_id = get_instance_id()
     print(f"Instance ID: {instance_id}")
     print(f"Algorithm: {args.algorithm}")
     print(f"Output directory: {args.output}")
     print(f"Timeout: {args.timeout}s")
+    if args.budget is not None:
+        print(f"Time budget: {args.budget}s")
+    if args.runtime_model:
+        print(f"Runtime model: {args.runtime_model}")
     print("-" * 50)
     
     # Create runner
@@ -130,29 +288,49 @@ Examples:
         instance_id=instance_id,
         output_dir=args.output,
         timeout_seconds=args.timeout,
-        matrices_dir=args.matrices_dir
+        matrices_dir=args.matrices_dir,
+        algorithm_options=algorithm_options,
+        warm_workers=args.warm_workers,
+        separate_memory_run=args.separate_memory_run,
+        repetition=repetition,
+        autorange=args.autorange,
+        autorange_min_seconds=args.autorange_min_seconds,
+        memory_sample_interval=args.memory_sample_interval,
+        resume=args.resume,
+        time_budget_seconds=args.budget,
+        runtime_models_path=args.runtime_model
     )
+    if args.resume:
+        print(f"Resumed {len(runner.results)} results from {runner.journal.path}")
+    elif runner.rotated_journal:
+        print(f"Previous journal moved to {runner.rotated_journal} (use --resume to continue it)")
     
     # Run benchmarks
-    if args.complexity_only:
-        sizes_str = f"custom {args.sizes}" if args.sizes else "default"
-        print(f"Running complexity analysis (sizes: {sizes_str})...")
-        runner.run_complexity_analysis(sizes=args.sizes)
-    elif args.presets_only:
-        print("Running preset benchmarks...")
-        runner.run_preset_benchmarks()
-    else:
-        print("Running full benchmark suite...")
-        print("\n=== PRESET BENCHMARKS ===")
-        runner.run_preset_benchmarks()
-        print("\n=== COMPLEXITY ANALYSIS ===")
-        runner.run_complexity_analysis(sizes=args.sizes)
+    try:
+        if args.complexity_only:
+            sizes_str = f"custom {args.sizes}" if args.sizes else "default"
+            print(f"Running complexity analysis (sizes: {sizes_str})...")
+            runner.run_complexity_analysis(sizes=args.sizes)
+        elif args.presets_only:
+            print("Running preset benchmarks...")
+            runner.run_preset_benchmarks(all_starts=args.all_starts)
+        else:
+            print("Running full benchmark suite...")
+            print("\n=== PRESET BENCHMARKS ===")
+            runner.run_preset_benchmarks(all_starts=args.all_starts)
+            print("\n=== COMPLEXITY ANALYSIS ===")
+            runner.run_complexity_analysis(sizes=args.sizes)
+    finally:
+        runner.close()
     
     # Save results
     output_file = runner.save(format=args.format)
     print("-" * 50)
     print(f"Results saved to: {output_file}")
     print(f"Total results: {len(runner.results)}")
+    skipped = sum(1 for r in runner.results if r.skipped)
+    if skipped:
+        print(f"Skipped (predicted timeout or budget): {skipped}")
     
     return 0
 
@@ -1,22 +1,94 @@
-from .brute_force import brute_force
-from .backtracking import backtracking
+from .brute_force import brute_force, brute_force_iterative
+from .backtracking import backtracking, backtracking_bounded, backtracking_iterative
 from .divide_and_conquer import divide_and_conquer
-from .memoization import memoization
-from .tabulation import tabulation
+from .memoization import memoization, memoization_stack
+from .tabulation import tabulation, tabulation_all_starts
+from .vectorized import (
+    vectorized,
+    vectorized_packed,
+    vectorized_checkpoint,
+    vectorized_all_starts,
+)
+from .all_starts import solve_each_start
+from .batch import batch_vectorized
+from .parallel_blocks import parallel_blocks
+from .threaded import threaded
+from .best_first import dijkstra, astar
+from .incremental import IncrementalSolver
+from .min_plus import TropicalSegmentTree
+from .streaming import streaming, streaming_columns
+from .parallel import (
+    parallel_brute_force,
+    parallel_divide_and_conquer,
+    parallel_backtracking,
+)
 
 ALGORITHMS = {
     "brute_force": brute_force,
+    "brute_force_iterative": brute_force_iterative,
     "backtracking": backtracking,
+    "backtracking_bounded": backtracking_bounded,
+    "backtracking_iterative": backtracking_iterative,
     "divide_and_conquer": divide_and_conquer,
+    "parallel_brute_force": parallel_brute_force,
+    "parallel_divide_and_conquer": parallel_divide_and_conquer,
+    "parallel_backtracking": parallel_backtracking,
+    "parallel_blocks": parallel_blocks,
     "memoization": memoization,
+    "memoization_stack": memoization_stack,
     "tabulation": tabulation,
+    "vectorized": vectorized,
+    "vectorized_packed": vectorized_packed,
+    "vectorized_checkpoint": vectorized_checkpoint,
+    "streaming": streaming,
+    "threaded": threaded,
+    "dijkstra": dijkstra,
+    "astar": astar,
+}
+
+# Engines that run their work in a ProcessPoolExecutor (unless workers=1)
+PROCESS_POOL_ALGORITHMS = {
+    "parallel_brute_force",
+    "parallel_divide_and_conquer",
+    "parallel_backtracking",
+    "parallel_blocks",
+}
+
+# Engines that solve every start row in a single pass
+ALL_STARTS_ALGORITHMS = {
+    "tabulation": tabulation_all_starts,
+    "vectorized": vectorized_all_starts,
 }
 
 __all__ = [
     "brute_force",
+    "brute_force_iterative",
     "backtracking",
+    "backtracking_bounded",
+    "backtracking_iterative",
     "divide_and_conquer", 
+    "parallel_brute_force",
+    "parallel_divide_and_conquer",
+    "parallel_backtracking",
+    "parallel_blocks",
+    "threaded",
     "memoization",
+    "memoization_stack",
     "tabulation",
+    "vectorized",
+    "vectorized_packed",
+    "vectorized_checkpoint",
+    "streaming",
+    "streaming_columns",
+    "dijkstra",
+    "astar",
+    "IncrementalSolver",
+    "TropicalSegmentTree",
+    "tabulation_all_starts",
+    "vectorized_all_starts",
+    "solve_each_start",
+    "batch_vectorized",
     "ALGORITHMS",
+    "ALL_STARTS_ALGORITHMS",
+    "PROCESS_POOL_ALGORITHMS",
 ]
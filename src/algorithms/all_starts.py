@@ -0,0 +1,45 @@
+"""Solve the matrix crossing from every start row of column 0."""
+
+
+def all_starts_result(costs, paths):
+    """
+    Bundle per-start solutions together with the global optimum.
+
+    Args:
+        costs: Minimum crossing cost for every start row
+        paths: Optimal path for every start row
+
+    Returns:
+        Dict with 'costs', 'paths', 'best_start', 'best_cost' and 'best_path'
+    """
+    if not costs:
+        return {"costs": [], "paths": [], "best_start": None,
+                "best_cost": 0.0, "best_path": []}
+    best_start = costs.index(min(costs))
+    return {
+        "costs": costs,
+        "paths": paths,
+        "best_start": best_start,
+        "best_cost": costs[best_start],
+        "best_path": paths[best_start],
+    }
+
+
+def solve_each_start(algorithm, M):
+    """
+    All-starts solution for engines without a native one.
+
+    Calls the single-start algorithm once per row of column 0.
+
+    Args:
+        algorithm: Function with signature algorithm(M, y)
+        M: 2D list representing the cost matrix
+
+    Returns:
+        Same dict as `all_starts_result`
+    """
+    if not M or not M[0]:
+        return all_starts_result([], [])
+    paths = [algorithm(M, y) for y in range(len(M))]
+    costs = [sum(M[row][col] for col, row in path) for path in paths]
+    return all_starts_result(costs, paths)
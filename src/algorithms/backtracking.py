@@ -1,5 +1,7 @@
 """Backtracking with Branch & Bound algorithm for matrix crossing."""
 
+from .tabulation import tabulation
+
 
 def backtracking(matriz, y=0):
     """
@@ -61,3 +63,184 @@ def backtracking(matriz, y=0):
     initial_path = [[0, y]]
     buscar_exhaustivo(y, 0, initial_cost, initial_path)
     return best_path
+
+
+def _greedy_path(matriz, y):
+    """Cheapest-next-cell path from row y (ties: up, straight, down)."""
+    rows = len(matriz)
+    path = [[0, y]]
+    row = y
+    for col in range(1, len(matriz[0])):
+        candidates = [(row - 1) % rows, row, (row + 1) % rows]
+        row = min(candidates, key=lambda r: matriz[r][col])
+        path.append([col, row])
+    return path
+
+
+def backtracking_bounded(matriz, y=0, incumbent="greedy", stats=None):
+    """
+    Find optimal path using branch & bound with admissible lower bounds.
+    
+    A node at column c with cost g is pruned when g plus the sum of the
+    column minima of columns c+1..n-1 cannot beat the incumbent. The
+    bound never overestimates, so negative values need no offset. The
+    search starts from a greedy (or DP) incumbent and tries the cheapest
+    child first. It runs on an explicit stack of per-column arrays (as in
+    `backtracking_iterative`), so the number of columns is not limited by
+    the recursion limit.
+    
+    Args:
+        matriz: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+        incumbent: Initial upper bound: 'greedy', 'dp' (tabulation) or None
+        stats: Optional dict filled with 'nodes_expanded', 'nodes_pruned'
+               and 'incumbent_cost'
+    
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not matriz or not matriz[0]:
+        return []
+    rows = len(matriz)
+    cols = len(matriz[0])
+    
+    # lower[c] = sum of column minima of columns c..cols-1
+    lower = [0] * (cols + 1)
+    for col in range(cols - 1, -1, -1):
+        lower[col] = lower[col + 1] + min(row[col] for row in matriz)
+    
+    if incumbent == "greedy":
+        best_path = _greedy_path(matriz, y)
+    elif incumbent == "dp":
+        best_path = tabulation(matriz, y)
+    elif incumbent is None:
+        best_path = []
+    else:
+        raise ValueError(f"Unknown incumbent: {incumbent}")
+    best_cost = sum(matriz[row][col] for col, row in best_path) if best_path else float('inf')
+    incumbent_cost = best_cost
+    expanded = 0
+    pruned = 0
+
+    last = cols - 1
+    cur_rows = [0] * cols
+    cur_costs = [0] * cols
+    children = [None] * cols  # Child rows of each column's node, cheapest first
+    next_child = [0] * cols
+    cur_rows[0] = y
+    cur_costs[0] = matriz[y][0]
+    
+    col = 0
+    entering = True
+    while col >= 0:
+        if entering:
+            entering = False
+            expanded += 1
+            cur_cost = cur_costs[col]
+            if col == last:
+                if cur_cost < best_cost:
+                    best_cost = cur_cost
+                    best_path = [[c, r] for c, r in enumerate(cur_rows)]
+                col -= 1
+                continue
+            if cur_cost + lower[col + 1] >= best_cost:
+                pruned += 1
+                col -= 1
+                continue
+            next_col = col + 1
+            cur_row = cur_rows[col]
+            children[col] = sorted(
+                [(cur_row - 1) % rows, cur_row, (cur_row + 1) % rows],
+                key=lambda r: matriz[r][next_col]
+            )
+            next_child[col] = 0
+        
+        k = next_child[col]
+        if k == 3:
+            col -= 1
+            continue
+        next_child[col] = k + 1
+        
+        next_row = children[col][k]
+        next_col = col + 1
+        cur_rows[next_col] = next_row
+        cur_costs[next_col] = cur_costs[col] + matriz[next_row][next_col]
+        col = next_col
+        entering = True
+    
+    if stats is not None:
+        stats["nodes_expanded"] = expanded
+        stats["nodes_pruned"] = pruned
+        stats["incumbent_cost"] = incumbent_cost
+    return best_path
+
+
+def backtracking_iterative(matriz, y=0):
+    """
+    Find optimal path using backtracking (branch & bound) with an explicit stack.
+    
+    Same offset transformation, pruning rule, search order and result as
+    `backtracking`, without recursion: the current path lives in
+    preallocated per-column arrays updated in place, the leaves of the
+    last column are evaluated inline, and the best path is kept as a
+    plain list of rows.
+    
+    Args:
+        matriz: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+    
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not matriz or not matriz[0]:
+        return []
+    rows = len(matriz)
+    cols = len(matriz[0])
+    if cols == 1:
+        return [[0, y]]
+    
+    offset = abs(min(min(row) for row in matriz))
+    matriz_pos = [[val + offset for val in row] for row in matriz]
+    
+    last = cols - 1
+    vecinos = [((r - 1) % rows, r, (r + 1) % rows) for r in range(rows)]
+    last_col = [row[last] for row in matriz_pos]
+    cur_rows = [0] * cols
+    cur_costs = [0] * cols
+    next_child = [0] * cols  # 0=up, 1=straight, 2=down
+    cur_rows[0] = y
+    cur_costs[0] = matriz_pos[y][0]
+    best_cost = float('inf')
+    best_rows = None
+    
+    col = 0
+    while col >= 0:
+        if col == last - 1:
+            # Evaluate the three end cells directly
+            base = cur_costs[col]
+            for next_row in vecinos[cur_rows[col]]:
+                next_cost = base + last_col[next_row]
+                if next_cost < best_cost:
+                    best_cost = next_cost
+                    cur_rows[last] = next_row
+                    best_rows = cur_rows[:]
+            col -= 1
+            continue
+        
+        k = next_child[col]
+        if k == 3:
+            col -= 1
+            continue
+        next_child[col] = k + 1
+        
+        next_row = vecinos[cur_rows[col]][k]
+        next_col = col + 1
+        next_cost = cur_costs[col] + matriz_pos[next_row][next_col]
+        # PRUNING: only descend while cheaper than the best known solution
+        if next_cost < best_cost:
+            cur_rows[next_col] = next_row
+            cur_costs[next_col] = next_cost
+            next_child[next_col] = 0
+            col = next_col
+    
+    return [[c, r] for c, r in enumerate(best_rows)]
@@ -0,0 +1,119 @@
+"""Best-first search (Dijkstra / A*) on the layered crossing graph."""
+
+import heapq
+
+
+def _best_first(M, y, shift, remaining, stats):
+    """
+    Best-first search from (y, 0) to any cell of the last column.
+
+    Each cell is a node of a layered DAG; its children are the up,
+    straight and down cells (toroidal) of the next column. Nodes are
+    popped by g + remaining[col] (deepest first on ties), so with a
+    consistent `remaining` the first cell of the last column popped
+    closes an optimal path.
+
+    Args:
+        M: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+        shift: Added to every cell cost (keeps Dijkstra weights >= 0)
+        remaining: Lower bound of the cost still to pay after each column
+        stats: Optional dict filled with 'nodes_expanded', 'peak_open_set'
+               and 'cells'
+    """
+    rows = len(M)
+    cols = len(M[0])
+    last = cols - 1
+    inf = float("inf")
+
+    start_cost = M[y][0] + shift
+    best_g = {(y, 0): start_cost}
+    parent = {}
+    closed = set()
+    open_set = [(start_cost + remaining[0], 0, y)]
+    expanded = 0
+    peak_open = 1
+
+    while open_set:
+        _, neg_col, row = heapq.heappop(open_set)
+        col = -neg_col
+        if (row, col) in closed:
+            continue
+        closed.add((row, col))
+        expanded += 1
+        if col == last:
+            break
+
+        g = best_g[(row, col)]
+        next_col = col + 1
+        for next_row in ((row - 1) % rows, row, (row + 1) % rows):
+            next_g = g + M[next_row][next_col] + shift
+            if next_g < best_g.get((next_row, next_col), inf):
+                best_g[(next_row, next_col)] = next_g
+                parent[(next_row, next_col)] = row
+                heapq.heappush(open_set, (next_g + remaining[next_col], -next_col, next_row))
+        if len(open_set) > peak_open:
+            peak_open = len(open_set)
+
+    if stats is not None:
+        stats["nodes_expanded"] = expanded
+        stats["peak_open_set"] = peak_open
+        stats["cells"] = rows * cols
+
+    path = [[col, row]]
+    while col > 0:
+        row = parent[(row, col)]
+        col -= 1
+        path.append([col, row])
+    path.reverse()
+    return path
+
+
+def dijkstra(M, y=0, stats=None):
+    """
+    Find optimal path using Dijkstra's algorithm (heapq).
+
+    Every path has exactly one cell per column, so adding the same shift
+    to all cells keeps the optimum while making all weights nonnegative.
+
+    Args:
+        M: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+        stats: Optional dict filled with 'nodes_expanded',
+               'peak_open_set' and 'cells'
+
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not M or not M[0]:
+        return []
+
+    shift = max(0, -min(min(row) for row in M))
+    return _best_first(M, y, shift, [0] * len(M[0]), stats)
+
+
+def astar(M, y=0, stats=None):
+    """
+    Find optimal path using A* guided by column-minimum suffix sums.
+
+    The heuristic after column c is the sum of the minima of columns
+    c+1..n-1: admissible and consistent, so no shift is needed for
+    negative values and no node is expanded twice.
+
+    Args:
+        M: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+        stats: Optional dict filled with 'nodes_expanded',
+               'peak_open_set' and 'cells'
+
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not M or not M[0]:
+        return []
+
+    cols = len(M[0])
+    remaining = [0] * cols
+    for col in range(cols - 2, -1, -1):
+        remaining[col] = remaining[col + 1] + min(row[col + 1] for row in M)
+    return _best_first(M, y, 0, remaining, stats)
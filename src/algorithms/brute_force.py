@@ -53,3 +53,69 @@ def brute_force(matriz, y=0):
     buscar(y, 0, costo_inicial, camino_inicial)
     
     return mejor_camino
+
+
+def brute_force_iterative(matriz, y=0):
+    """
+    Find optimal path using pure brute force with an explicit stack.
+    
+    Same search order and result as `brute_force`, without recursion:
+    the current path lives in preallocated per-column arrays (row, cost
+    and next child to try) that are updated in place, the leaves of the
+    last column are evaluated inline, and the best path is kept as a
+    plain list of rows.
+    
+    Args:
+        matriz: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+    
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not matriz or not matriz[0]:
+        return []
+    
+    m = len(matriz)
+    n = len(matriz[0])
+    if n == 1:
+        return [[0, y]]
+    
+    last = n - 1
+    vecinos = [((f - 1) % m, f, (f + 1) % m) for f in range(m)]
+    ultima = [fila[last] for fila in matriz]
+    filas = [0] * n
+    costos = [0] * n
+    siguiente = [0] * n  # Next child per column: 0=up, 1=straight, 2=down
+    filas[0] = y
+    costos[0] = matriz[y][0]
+    mejor_costo = float('inf')
+    mejor_filas = None
+    
+    col = 0
+    while col >= 0:
+        if col == last - 1:
+            # Evaluate the three end cells directly
+            base = costos[col]
+            for nf in vecinos[filas[col]]:
+                costo = base + ultima[nf]
+                if costo < mejor_costo:
+                    mejor_costo = costo
+                    filas[last] = nf
+                    mejor_filas = filas[:]
+            col -= 1
+            continue
+        
+        k = siguiente[col]
+        if k == 3:
+            col -= 1
+            continue
+        siguiente[col] = k + 1
+        
+        nf = vecinos[filas[col]][k]
+        nc = col + 1
+        filas[nc] = nf
+        costos[nc] = costos[col] + matriz[nf][nc]
+        siguiente[nc] = 0
+        col = nc
+    
+    return [[c, f] for c, f in enumerate(mejor_filas)]
@@ -0,0 +1,119 @@
+"""Incremental re-solve of the tabulation recurrence after point updates."""
+
+import numpy as np
+
+
+class IncrementalSolver:
+    """
+    Keep the right-to-left `tabulation` costs table up to date under updates.
+
+    A cell change at column c only affects the cost columns 0..c, so
+    `update` just records the dirty range; the next query recomputes from
+    the rightmost dirty column leftwards and stops as soon as a recomputed
+    column left of every dirty column comes out unchanged. Paths and costs
+    are identical to `tabulation` on the current matrix.
+
+    Attributes:
+        columns_recomputed: Total cost columns recomputed so far
+                            (the initial solve counts every column)
+    """
+
+    def __init__(self, M):
+        """
+        Args:
+            M: 2D list or ndarray representing the cost matrix (copied)
+        """
+        self.A = np.array(M, dtype=np.float64)
+        if self.A.size == 0:
+            self.A = self.A.reshape(0, 0)
+        self.h, self.w = self.A.shape
+        # costs[i] is the cost column i (contiguous per column)
+        self.costs = np.empty((self.w, self.h))
+        self.columns_recomputed = 0
+        self._dirty = (0, self.w - 1) if self.A.size else None
+        self._refresh()
+
+    def update(self, row, col, value):
+        """
+        Set M[row][col] = value; the costs are recomputed lazily.
+
+        Args:
+            row: Row of the cell (0-indexed)
+            col: Column of the cell (0-indexed)
+            value: New cost of the cell
+        """
+        if not (0 <= row < self.h and 0 <= col < self.w):
+            raise IndexError(f"Cell ({row}, {col}) outside a {self.h}x{self.w} matrix")
+        if self.A[row, col] == value:
+            return
+        self.A[row, col] = value
+        if self._dirty is None:
+            self._dirty = (col, col)
+        else:
+            self._dirty = (min(self._dirty[0], col), max(self._dirty[1], col))
+
+    def _column(self, i):
+        """Cost column i from the (up-to-date) column i + 1."""
+        nxt = self.costs[i + 1]
+        best = np.minimum(nxt, np.roll(nxt, 1))
+        np.minimum(best, np.roll(nxt, -1), out=best)
+        return np.add(self.A[:, i], best, out=best)
+
+    def _refresh(self):
+        """Recompute the dirty cost columns, right to left."""
+        if self._dirty is None:
+            return
+        first, last = self._dirty
+        self._dirty = None
+
+        if last == self.w - 1:
+            self.costs[last] = self.A[:, last]
+            self.columns_recomputed += 1
+            last -= 1
+        for i in range(last, -1, -1):
+            column = self._column(i)
+            self.columns_recomputed += 1
+            if i <= first and np.array_equal(column, self.costs[i]):
+                break
+            self.costs[i] = column
+
+    def best_cost(self, start=0):
+        """
+        Minimum crossing cost from the given start row.
+
+        Args:
+            start: Starting row position (0-indexed)
+
+        Returns:
+            Cost of the optimal path, or 0 for an empty matrix
+        """
+        if self.A.size == 0:
+            return 0
+        self._refresh()
+        return self.costs[0].item(start)
+
+    def best_path(self, start=0):
+        """
+        Optimal path from the given start row, tie-broken like `tabulation`.
+
+        Args:
+            start: Starting row position (0-indexed)
+
+        Returns:
+            List of [col, row] positions representing the optimal path
+        """
+        if self.A.size == 0:
+            return []
+        self._refresh()
+
+        h = self.h
+        path = [[0, start]]
+        row = start
+        for i in range(1, self.w):
+            column = self.costs[i]
+            y_up = h - 1 if row == 0 else row - 1
+            y_down = 0 if row == h - 1 else row + 1
+            cost = [column.item(y_up), column.item(row), column.item(y_down)]
+            row = (y_up, row, y_down)[cost.index(min(cost))]
+            path.append([i, row])
+        return path
@@ -56,3 +56,75 @@ def memoization(M, y=0):
         return data[sy][sx]
     
     return _recursive_cross(M, 0, y)
+
+
+def memoization_stack(M, y=0):
+    """
+    Find optimal path using memoization with an explicit stack.
+    
+    Top-down like `memoization`, but each state stores only its scalar
+    cost and the chosen move (0=up, 1=straight, 2=down) instead of a full
+    path, and states are resolved with an explicit stack instead of
+    recursion. The path is rebuilt once at the end, so time and memory
+    are O(m × n) and wide matrices do not hit the recursion limit.
+    
+    Args:
+        M: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+    
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not M or not M[0]:
+        return []
+    
+    num_rows = len(M)
+    num_cols = len(M[0])
+    last = num_cols - 1
+    cost = [[None] * num_cols for _ in range(num_rows)]
+    move = [bytearray(num_cols) for _ in range(num_rows)]
+    
+    stack = [(y, 0)]
+    while stack:
+        sy, sx = stack[-1]
+        if cost[sy][sx] is not None:
+            stack.pop()
+            continue
+        
+        if sx == last:
+            cost[sy][sx] = M[sy][sx]
+            stack.pop()
+            continue
+        
+        next_sx = sx + 1
+        up = _front(M, sy - 1)
+        down = _front(M, sy + 1)
+        cost_up = cost[up][next_sx]
+        cost_here = cost[sy][next_sx]
+        cost_down = cost[down][next_sx]
+        if cost_up is None or cost_here is None or cost_down is None:
+            # Resolve missing neighbours first (up is popped first)
+            if cost_down is None:
+                stack.append((down, next_sx))
+            if cost_here is None:
+                stack.append((sy, next_sx))
+            if cost_up is None:
+                stack.append((up, next_sx))
+            continue
+        
+        stack.pop()
+        best, best_move = cost_up, 0
+        if cost_here < best:
+            best, best_move = cost_here, 1
+        if cost_down < best:
+            best, best_move = cost_down, 2
+        cost[sy][sx] = M[sy][sx] + best
+        move[sy][sx] = best_move
+    
+    path = [[0, y]]
+    row = y
+    for sx in range(last):
+        row = _front(M, row + move[row][sx] - 1)
+        path.append([sx + 1, row])
+    
+    return path
@@ -0,0 +1,142 @@
+"""Tropical (min-plus) segment tree over the columns of a cost matrix."""
+
+import numpy as np
+
+# Cap on the (rows, m, m) temporary of one min-plus product block
+_BLOCK_CELLS = 1 << 20
+
+
+def _step(T):
+    """Extend every exit row of T by one up/straight/down move (toroidal)."""
+    return np.minimum(np.minimum(T, np.roll(T, 1, axis=-1)), np.roll(T, -1, axis=-1))
+
+
+def _min_plus(A, B):
+    """Min-plus product: C[i][j] = min_k A[i][k] + B[k][j]."""
+    C = np.empty((A.shape[0], B.shape[1]))
+    rows = max(1, _BLOCK_CELLS // B.size)
+    for i in range(0, A.shape[0], rows):
+        np.min(A[i:i + rows, :, None] + B, axis=1, out=C[i:i + rows])
+    return C
+
+
+class TropicalSegmentTree:
+    """
+    Segment tree of min-plus transfer matrices over column ranges.
+
+    The node covering columns [l, r] stores the m x m matrix T with
+    T[i][j] = cheapest path entering column l at row i and leaving column
+    r at row j (both cells included). Two adjacent ranges combine as
+    step(T_left) (min,+) T_right, so a column-range query walks O(log n)
+    nodes with an O(m^2) vector product each, and a point update rebuilds
+    O(log n) nodes with an O(m^3) product each. Memory is about
+    2n * m^2 floats.
+    """
+
+    def __init__(self, M):
+        """
+        Args:
+            M: 2D list or ndarray representing the cost matrix
+        """
+        A = np.array(M, dtype=np.float64)
+        if A.size == 0:
+            raise ValueError("TropicalSegmentTree needs a non-empty matrix")
+        self.h, self.w = A.shape
+        self.A = A
+        self.nodes = [None] * (4 * self.w)
+        self._build(1, 0, self.w - 1)
+
+    def _leaf(self, col):
+        T = np.full((self.h, self.h), np.inf)
+        np.fill_diagonal(T, self.A[:, col])
+        return T
+
+    def _combine(self, node):
+        self.nodes[node] = _min_plus(_step(self.nodes[2 * node]), self.nodes[2 * node + 1])
+
+    def _build(self, node, lo, hi):
+        if lo == hi:
+            self.nodes[node] = self._leaf(lo)
+            return
+        mid = (lo + hi) // 2
+        self._build(2 * node, lo, mid)
+        self._build(2 * node + 1, mid + 1, hi)
+        self._combine(node)
+
+    def update(self, row, col, value):
+        """
+        Set M[row][col] = value and rebuild the nodes covering that column.
+
+        Args:
+            row: Row of the cell (0-indexed)
+            col: Column of the cell (0-indexed)
+            value: New cost of the cell
+        """
+        if not (0 <= row < self.h and 0 <= col < self.w):
+            raise IndexError(f"Cell ({row}, {col}) outside a {self.h}x{self.w} matrix")
+        self.A[row, col] = value
+
+        node, lo, hi = 1, 0, self.w - 1
+        ancestors = []
+        while lo != hi:
+            ancestors.append(node)
+            mid = (lo + hi) // 2
+            if col <= mid:
+                node, hi = 2 * node, mid
+            else:
+                node, lo = 2 * node + 1, mid + 1
+        self.nodes[node][row, row] = value
+        for node in reversed(ancestors):
+            self._combine(node)
+
+    def _cover(self, node, lo, hi, a, b, out):
+        """Append the nodes covering [a, b] within [lo, hi], left to right."""
+        if b < lo or hi < a:
+            return
+        if a <= lo and hi <= b:
+            out.append(node)
+            return
+        mid = (lo + hi) // 2
+        self._cover(2 * node, lo, mid, a, b, out)
+        self._cover(2 * node + 1, mid + 1, hi, a, b, out)
+
+    def query_costs(self, a, b, row):
+        """
+        Cheapest crossing of columns a..b from row `row`, per exit row.
+
+        Args:
+            a: First column of the window (0-indexed)
+            b: Last column of the window (inclusive)
+            row: Entry row in column a
+
+        Returns:
+            ndarray of length m: cost of the best path ending at each row
+            of column b
+        """
+        if not (0 <= a <= b < self.w):
+            raise IndexError(f"Column range [{a}, {b}] outside a matrix of {self.w} columns")
+        if not 0 <= row < self.h:
+            raise IndexError(f"Row {row} outside a matrix of {self.h} rows")
+
+        nodes = []
+        self._cover(1, 0, self.w - 1, a, b, nodes)
+        costs = self.nodes[nodes[0]][row].copy()
+        for node in nodes[1:]:
+            costs = np.min(_step(costs)[:, None] + self.nodes[node], axis=0)
+        return costs
+
+    def query(self, a, b, row):
+        """
+        Minimum cost of crossing columns a..b (inclusive) starting at row.
+
+        Same value as `tabulation` on the sub-window starting at `row`.
+
+        Args:
+            a: First column of the window (0-indexed)
+            b: Last column of the window (inclusive)
+            row: Entry row in column a
+
+        Returns:
+            Cost of the optimal path across the window
+        """
+        return self.query_costs(a, b, row).min().item()
@@ -0,0 +1,254 @@
+"""Process-parallel exhaustive search by path-prefix partitioning."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Lock, RawValue
+
+from .brute_force import brute_force
+from .divide_and_conquer import divide_and_conquer
+
+# Per-worker state, set once by the pool initializer
+_matrix = None
+_suffix_matrix = None
+_engine = None
+_bound = None
+_bound_lock = None
+
+
+def _init_worker(matrix, depth, engine):
+    """Store the matrix and the columns below the prefixes in the worker."""
+    global _matrix, _suffix_matrix, _engine
+    _matrix = matrix
+    _suffix_matrix = [row[depth:] for row in matrix]
+    _engine = engine
+
+
+def _clear_worker():
+    """Drop the per-worker state, so an in-process run doesn't keep the matrix alive."""
+    global _matrix, _suffix_matrix, _engine, _bound, _bound_lock
+    _matrix = _suffix_matrix = _engine = _bound = _bound_lock = None
+
+
+def _default_depth(cols, workers):
+    """Smallest prefix depth giving at least 4 subtrees per worker."""
+    depth = 0
+    while 3 ** depth < 4 * workers and depth < cols - 1:
+        depth += 1
+    return depth
+
+
+def _prefixes(rows, y, depth):
+    """All row sequences of length depth + 1 from row y, in DFS order."""
+    prefixes = [(y,)]
+    for _ in range(depth):
+        prefixes = [
+            prefix + (next_row,)
+            for prefix in prefixes
+            for next_row in ((prefix[-1] - 1) % rows, prefix[-1], (prefix[-1] + 1) % rows)
+        ]
+    return prefixes
+
+
+def _solve_prefix(prefix):
+    """Exhaustively search the subtree below one prefix."""
+    depth = len(prefix) - 1
+    suffix = _engine(_suffix_matrix, prefix[-1])
+    path = [[col, row] for col, row in enumerate(prefix[:-1])]
+    path += [[col + depth, row] for col, row in suffix]
+    cost = sum(_matrix[row][col] for col, row in path)
+    return cost, path
+
+
+def parallel_exhaustive(engine, M, y=0, depth=None, workers=None):
+    """
+    Run an exhaustive engine over path-prefix subtrees in a process pool.
+    
+    The search tree is cut at `depth` columns: each of the 3^depth
+    prefixes from row y is a task, and its subtree is searched by
+    `engine` on the remaining columns. Per-subtree bests are reduced in
+    DFS order, so the first optimal path wins like in the serial engines.
+    
+    Args:
+        engine: Exhaustive algorithm with signature engine(M, y)
+        M: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+        depth: Prefix length in columns (default: enough for 4 tasks per worker)
+        workers: Number of processes (default: os.cpu_count()); 1 runs
+                 the same partitioned search in-process
+    
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not M or not M[0]:
+        return []
+    
+    workers = workers or os.cpu_count() or 1
+    if depth is None:
+        depth = _default_depth(len(M[0]), workers)
+    depth = min(depth, len(M[0]) - 1)
+    prefixes = _prefixes(len(M), y, depth)
+    
+    if workers == 1:
+        _init_worker(M, depth, engine)
+        try:
+            return _reduce(map(_solve_prefix, prefixes))
+        finally:
+            _clear_worker()
+    
+    chunksize = max(1, len(prefixes) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(M, depth, engine)
+    ) as executor:
+        return _reduce(executor.map(_solve_prefix, prefixes, chunksize=chunksize))
+
+
+def _reduce(results):
+    """Keep the first path with the minimum cost."""
+    best_cost = float('inf')
+    best_path = []
+    for cost, path in results:
+        if cost < best_cost:
+            best_cost = cost
+            best_path = path
+    return best_path
+
+
+def parallel_brute_force(M, y=0, depth=None, workers=None):
+    """
+    Find optimal path with brute force split over a process pool.
+    
+    See `parallel_exhaustive` for how the tree is partitioned.
+    
+    Args:
+        M: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+        depth: Prefix length in columns
+        workers: Number of processes (default: os.cpu_count())
+    
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    return parallel_exhaustive(brute_force, M, y, depth, workers)
+
+
+def parallel_divide_and_conquer(M, y=0, depth=None, workers=None):
+    """
+    Find optimal path with divide & conquer split over a process pool.
+    
+    See `parallel_exhaustive` for how the tree is partitioned.
+    
+    Args:
+        M: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+        depth: Prefix length in columns
+        workers: Number of processes (default: os.cpu_count())
+    
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    return parallel_exhaustive(divide_and_conquer, M, y, depth, workers)
+
+
+def _init_bnb_worker(matrix, bound, bound_lock):
+    """Store the shifted matrix and the shared global bound in the worker."""
+    global _matrix, _bound, _bound_lock
+    # Same offset transformation as `backtracking`: all values >= 0
+    offset = abs(min(min(row) for row in matrix))
+    _matrix = [[val + offset for val in row] for row in matrix]
+    _bound = bound
+    _bound_lock = bound_lock
+
+
+def _branch_and_bound_prefix(prefix):
+    """Branch & bound below one prefix, pruning against the global bound."""
+    matriz = _matrix
+    rows = len(matriz)
+    cols = len(matriz[0])
+    bound = _bound
+    best_cost = float('inf')
+    best_rows = None
+    nodes = 0
+    pruned = 0
+    cur_rows = list(prefix) + [0] * (cols - len(prefix))
+
+    def buscar(cur_row, cur_col, cur_cost):
+        nonlocal best_cost, best_rows, nodes, pruned
+        nodes += 1
+        if cur_col == cols - 1:
+            if cur_cost < best_cost and cur_cost < bound.value:
+                best_cost = cur_cost
+                best_rows = cur_rows.copy()
+                with _bound_lock:
+                    if cur_cost < bound.value:
+                        bound.value = cur_cost
+            return
+        if cur_cost >= best_cost or cur_cost >= bound.value:
+            pruned += 1
+            return
+        next_col = cur_col + 1
+        for next_row in ((cur_row - 1) % rows, cur_row, (cur_row + 1) % rows):
+            cur_rows[next_col] = next_row
+            buscar(next_row, next_col, cur_cost + matriz[next_row][next_col])
+
+    prefix_cost = sum(matriz[row][col] for col, row in enumerate(prefix))
+    buscar(prefix[-1], len(prefix) - 1, prefix_cost)
+    path = [[col, row] for col, row in enumerate(best_rows)] if best_rows else []
+    return best_cost, path, os.getpid(), nodes, pruned
+
+
+def parallel_backtracking(M, y=0, depth=None, workers=None, stats=None):
+    """
+    Find optimal path with branch & bound split over a process pool.
+    
+    Subtrees below the 3^depth path prefixes are searched by different
+    workers. Every improved complete path is published to a shared
+    bound (shared memory), and all workers prune against that global
+    incumbent instead of only their own best.
+    
+    Args:
+        M: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+        depth: Prefix length in columns (default: enough for 4 tasks per worker)
+        workers: Number of processes (default: os.cpu_count())
+        stats: Optional dict filled with 'nodes_expanded', 'nodes_pruned'
+               and 'nodes_per_worker' (one count per worker process)
+    
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not M or not M[0]:
+        return []
+    
+    workers = workers or os.cpu_count() or 1
+    if depth is None:
+        depth = _default_depth(len(M[0]), workers)
+    depth = min(depth, len(M[0]) - 1)
+    prefixes = _prefixes(len(M), y, depth)
+    bound = RawValue('d', float('inf'))
+    bound_lock = Lock()
+    
+    if workers == 1:
+        _init_bnb_worker(M, bound, bound_lock)
+        try:
+            results = list(map(_branch_and_bound_prefix, prefixes))
+        finally:
+            _clear_worker()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_bnb_worker,
+            initargs=(M, bound, bound_lock)
+        ) as executor:
+            results = list(executor.map(_branch_and_bound_prefix, prefixes))
+    
+    if stats is not None:
+        per_worker = {}
+        for _, _, pid, nodes, _ in results:
+            per_worker[pid] = per_worker.get(pid, 0) + nodes
+        stats["nodes_expanded"] = sum(result[3] for result in results)
+        stats["nodes_pruned"] = sum(result[4] for result in results)
+        stats["nodes_per_worker"] = [per_worker[pid] for pid in sorted(per_worker)]
+    
+    return _reduce((cost, path) for cost, path, _, _, _ in results)
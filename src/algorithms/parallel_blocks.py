@@ -0,0 +1,161 @@
+"""Process-parallel wide-matrix DP via block min-plus transfer matrices."""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .vectorized import _as_array, _chunk_cols, _ColumnSweep, _follow_moves, _sweep_range
+
+# Per-worker state, set once by the pool initializer
+_matrix = None
+
+
+def _init_worker(matrix):
+    """Store the matrix array in the worker."""
+    global _matrix
+    _matrix = matrix
+
+
+def _block_bounds(w, blocks):
+    """Split columns 0..w-1 into `blocks` contiguous (first, last) ranges."""
+    edges = np.linspace(0, w, blocks + 1).astype(int)
+    return [(int(a), int(b) - 1) for a, b in zip(edges, edges[1:]) if b > a]
+
+
+def _transfer(bounds):
+    """
+    Min-plus transfer matrix of one column block.
+
+    T[i][j] is the cheapest path entering the block's first column at
+    row i and leaving its last column at row j. Computed left to right,
+    one vectorized step over all (entry, exit) pairs per column.
+    """
+    first, last = bounds
+    h = _matrix.shape[0]
+    ext = np.full((h, h + 2), np.inf)
+    center = ext[:, 1:h + 1]
+    np.fill_diagonal(center, _matrix[:, first])
+    best = np.empty((h, h))
+    for col in range(first + 1, last + 1):
+        ext[:, 0] = ext[:, h]
+        ext[:, h + 1] = ext[:, 1]
+        np.minimum(ext[:, :h], center, out=best)
+        np.minimum(best, ext[:, 2:], out=best)
+        np.add(best, _matrix[:, col], out=center)
+    return center.copy()
+
+
+def _block_path(task):
+    """Optimal path through one block between a fixed entry and exit row."""
+    first, last, entry, exit_row = task
+    if first == last:
+        return [[first, entry]]
+    h = _matrix.shape[0]
+    sweep = _ColumnSweep((h,), _chunk_cols((h,)))
+    terminal = np.full(h, np.inf)
+    terminal[exit_row] = _matrix[exit_row, last]
+    sweep.load(terminal)
+    moves = np.empty((last - first, h), dtype=np.int8)
+    _sweep_range(sweep, _matrix, first, last, moves)
+    return [[first + col, row] for col, row in _follow_moves(moves, entry)]
+
+
+def _step_min(costs):
+    """Cheapest of the up/straight/down neighbours for every row."""
+    return np.minimum(np.minimum(np.roll(costs, 1), costs), np.roll(costs, -1))
+
+
+def parallel_blocks(M, y=0, blocks=None, workers=None, stats=None):
+    """
+    Find optimal path by splitting the columns into blocks solved in parallel.
+
+    1. Each worker computes the m x m min-plus transfer matrix of a block
+       (O(m^2) work per column).
+    2. The blocks are combined right to left with vector-matrix products
+       (O(m^2) per block), giving the cost-to-go at every block entry,
+       and the entry/exit row of every block on the optimal path.
+    3. Each worker rebuilds the path inside a block between its fixed
+       entry and exit rows with a NumPy column sweep.
+
+    Meant for matrices with few rows and many columns: the transfer
+    matrices cost m times more work than `vectorized`, so it only pays
+    off with several cores. The path is optimal; among equal-cost paths
+    the choice may differ from `tabulation`.
+
+    Args:
+        M: 2D list or ndarray representing the cost matrix
+        y: Starting row position (0-indexed)
+        blocks: Number of column blocks (default: 4 per worker)
+        workers: Number of processes (default: os.cpu_count()); 1 runs
+                 the same blocked solve in-process
+        stats: Optional dict filled with 'blocks', 'workers' and the
+               'transfer_seconds', 'combine_seconds' and
+               'reconstruct_seconds' of each phase
+
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if len(M) == 0 or len(M[0]) == 0:
+        return []
+
+    A = _as_array(M)
+    h, w = A.shape
+    workers = workers or os.cpu_count() or 1
+    bounds = _block_bounds(w, min(w, blocks or 4 * workers))
+
+    if workers == 1:
+        _init_worker(A)
+        try:
+            return _solve_blocks(map, bounds, y, stats, workers)
+        finally:
+            _init_worker(None)  # Don't keep the matrix alive after the call
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(A,)
+    ) as executor:
+        return _solve_blocks(executor.map, bounds, y, stats, workers)
+
+
+def _solve_blocks(map_fn, bounds, y, stats, workers):
+    """Run the three phases of `parallel_blocks` with the given map."""
+    started = time.perf_counter()
+    transfers = list(map_fn(_transfer, bounds))
+    transferred = time.perf_counter()
+
+    # Cost of the cheapest continuation after leaving each block at row j
+    h = transfers[0].shape[0]
+    after = [None] * len(bounds)
+    after[-1] = np.zeros(h)
+    entry_costs = [None] * len(bounds)
+    for b in range(len(bounds) - 1, -1, -1):
+        entry_costs[b] = (transfers[b] + after[b]).min(axis=1)
+        if b > 0:
+            after[b - 1] = _step_min(entry_costs[b])
+
+    # Entry and exit row of every block, tie-broken up/straight/down
+    tasks = []
+    entry = y
+    for b, (first, last) in enumerate(bounds):
+        exit_row = int(np.argmin(transfers[b][entry] + after[b]))
+        tasks.append((first, last, entry, exit_row))
+        if b + 1 < len(bounds):
+            options = [(exit_row - 1) % h, exit_row, (exit_row + 1) % h]
+            costs = [entry_costs[b + 1].item(row) for row in options]
+            entry = options[costs.index(min(costs))]
+    combined = time.perf_counter()
+
+    path = []
+    for block_path in map_fn(_block_path, tasks):
+        path.extend(block_path)
+
+    if stats is not None:
+        stats["blocks"] = len(bounds)
+        stats["workers"] = workers
+        stats["transfer_seconds"] = transferred - started
+        stats["combine_seconds"] = combined - transferred
+        stats["reconstruct_seconds"] = time.perf_counter() - combined
+    return path
@@ -0,0 +1,127 @@
+"""Out-of-core (streaming) dynamic programming for matrix crossing."""
+
+import itertools
+import os
+import tempfile
+
+import numpy as np
+
+from .vectorized import _ColumnSweep, _chunk_cols, _pack_moves, _packed_moves_shape
+
+
+def _matrix_chunks(M):
+    """Yield (rows, n) blocks of consecutive columns from a matrix source."""
+    if isinstance(M, (str, os.PathLike)):
+        M = np.load(M, mmap_mode="r")
+    elif not isinstance(M, np.ndarray):
+        M = np.asarray(M, dtype=np.float64)
+    chunk = _chunk_cols(M.shape[:1])
+    for start in range(0, M.shape[1], chunk):
+        yield np.asarray(M[:, start:start + chunk], dtype=np.float64)
+
+
+def _column_chunks(columns):
+    """Yield (rows, n) blocks of consecutive columns from a column iterator."""
+    block = []
+    limit = None
+    for column in columns:
+        block.append(column)
+        if limit is None:
+            limit = _chunk_cols((len(column),))
+        if len(block) == limit:
+            yield np.array(block, dtype=np.float64).T
+            block = []
+    if block:
+        yield np.array(block, dtype=np.float64).T
+
+
+def _solve_stream(chunks, y, spill_dir):
+    """
+    Forward DP over column blocks, spilling packed moves to a temp file.
+
+    Sweeping the columns in stream order is the regular right-to-left
+    sweep of the column-reversed matrix, started from a cost column that
+    is infinite everywhere except at row y. Each stored move points to
+    the predecessor row in the previous column.
+    """
+    first = next(chunks, None)
+    if first is None or first.shape[0] == 0:
+        return []
+
+    h = first.shape[0]
+    chunk = _chunk_cols((h,))
+    sweep = _ColumnSweep((h,), chunk)
+    start_costs = np.full(h, np.inf)
+    start_costs[y] = first[y, 0]
+    sweep.load(start_costs)
+    block = np.empty((chunk, h), dtype=np.int8)
+
+    w = 1
+    with tempfile.TemporaryFile(dir=spill_dir) as spill:
+        for columns in itertools.chain([first[:, 1:]], chunks):
+            for start in range(0, columns.shape[1], chunk):
+                piece = columns[:, start:start + chunk]
+                n = piece.shape[1]
+                sweep.sweep(piece[:, ::-1], block[:n])
+                spill.write(_pack_moves(block[:n][::-1]).tobytes())
+                w += n
+
+        row = int(np.argmin(sweep.costs))
+        rows = [row]
+        if w > 1:
+            spill.flush()
+            packed = np.memmap(spill, dtype=np.uint8, mode="r",
+                               shape=_packed_moves_shape(w, h))
+            for i in range(w - 2, -1, -1):
+                move = (packed[i].item(row >> 2) >> ((row & 3) << 1)) & 3
+                row = (row + move - 1) % h
+                rows.append(row)
+            del packed
+
+    rows.reverse()
+    return [[col, row] for col, row in enumerate(rows)]
+
+
+def streaming_columns(columns, y=0, spill_dir=None):
+    """
+    Find optimal path from an iterator of columns, one column at a time.
+
+    Only one cost column and one block of columns are held in memory;
+    backpointers are packed to 2 bits per cell and spilled to a temporary
+    file, which is memory-mapped to rebuild the path at the end. The path
+    is optimal, but ties may be broken differently than `tabulation`
+    (the DP runs left to right).
+
+    Args:
+        columns: Iterable of columns (each a sequence of row values),
+                 from left to right
+        y: Starting row position (0-indexed)
+        spill_dir: Directory for the temporary backpointer file
+                   (default: system temp dir)
+
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    return _solve_stream(_column_chunks(columns), y, spill_dir)
+
+
+def streaming(M, y=0, spill_dir=None):
+    """
+    Find optimal path reading the matrix column block by column block.
+
+    Same solver as `streaming_columns`, for matrix sources: a 2D list,
+    an ndarray/np.memmap, or the path to a .npy file (opened memory-mapped,
+    never loaded whole). Store large matrices in Fortran order so column
+    blocks are contiguous on disk.
+
+    Args:
+        M: 2D list, ndarray, memmap or .npy path with the cost matrix
+        y: Starting row position (0-indexed)
+        spill_dir: Directory for the temporary backpointer file
+
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not isinstance(M, (str, os.PathLike)) and (len(M) == 0 or len(M[0]) == 0):
+        return []
+    return _solve_stream(_matrix_chunks(M), y, spill_dir)
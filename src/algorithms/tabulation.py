@@ -1,25 +1,13 @@
 """Tabulation (Bottom-up Dynamic Programming) algorithm for matrix crossing."""
 
+from .all_starts import all_starts_result
 
-def tabulation(M, y=0):
-    """
-    Find optimal path using tabulation (bottom-up dynamic programming).
-    
-    Args:
-        M: 2D list representing the cost matrix
-        y: Starting row position (0-indexed)
-    
-    Returns:
-        List of [col, row] positions representing the optimal path
-    """
-    if not M or not M[0]:
-        return []
-    
+
+def _fill_costs(M):
+    """Fill the costs table from right to left."""
     h = len(M)
     w = len(M[0])
     inf = float("inf")
-    path = [[0, y]]
-    row = y
     
     # Initialize costs table
     costs = [[inf for _ in range(w)] for _ in range(h)]
@@ -39,7 +27,16 @@ def tabulation(M, y=0):
                 costs[y_down][i + 1]
             )
     
-    # Reconstruct path from left to right
+    return costs
+
+
+def _reconstruct(costs, y):
+    """Reconstruct path from left to right starting at row y."""
+    h = len(costs)
+    w = len(costs[0])
+    path = [[0, y]]
+    row = y
+    
     for i in range(w - 1):
         y_up = h - 1 if row == 0 else row - 1
         y_down = 0 if row == h - 1 else row + 1
@@ -52,3 +49,42 @@ def tabulation(M, y=0):
         path.append(neighbors[min_path])
     
     return path
+
+
+def tabulation(M, y=0):
+    """
+    Find optimal path using tabulation (bottom-up dynamic programming).
+    
+    Args:
+        M: 2D list representing the cost matrix
+        y: Starting row position (0-indexed)
+    
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if not M or not M[0]:
+        return []
+    
+    return _reconstruct(_fill_costs(M), y)
+
+
+def tabulation_all_starts(M):
+    """
+    Solve from every start row with a single costs table.
+    
+    The table is filled once; only the O(n) reconstruction is repeated
+    per start row.
+    
+    Args:
+        M: 2D list representing the cost matrix
+    
+    Returns:
+        Dict with per-start 'costs' and 'paths', plus 'best_start',
+        'best_cost' and 'best_path' for the global optimum
+    """
+    if not M or not M[0]:
+        return all_starts_result([], [])
+    
+    costs = _fill_costs(M)
+    paths = [_reconstruct(costs, y) for y in range(len(M))]
+    return all_starts_result([row[0] for row in costs], paths)
@@ -0,0 +1,140 @@
+"""Row-sharded multithreaded DP (NumPy kernels release the GIL)."""
+
+import os
+import threading
+import time
+
+import numpy as np
+
+from .vectorized import DOWN, _as_array, _follow_moves
+
+# Smallest shard worth a thread by default: below this, the per-column
+# barrier costs more than the NumPy kernels it parallelizes
+_MIN_SHARD_ROWS = 1 << 16
+
+
+def _shard_bounds(h, threads):
+    """Split rows 0..h-1 into `threads` contiguous [lo, hi) shards."""
+    edges = np.linspace(0, h, threads + 1).astype(int)
+    return [(int(lo), int(hi)) for lo, hi in zip(edges, edges[1:])]
+
+
+def _sweep_shard(A, ext, moves, lo, hi, barrier, timing):
+    """
+    Sweep all columns right to left for rows [lo, hi).
+
+    `ext` holds two padded cost columns used alternately; index r + 1 is
+    row r, and indices 0 and h + 1 are the wrapped halos. The shard owning
+    row 0 (row h - 1) writes the bottom (top) halo after every column, and
+    the barrier makes the whole column visible before the next one starts.
+    """
+    h = A.shape[0]
+    w = A.shape[1]
+    n = hi - lo
+    best = np.empty(n)
+    to_straight = np.empty(n, dtype=bool)
+    to_down = np.empty(n, dtype=bool)
+    scratch = np.empty(n, dtype=np.int8)
+    busy = 0.0
+    waited = 0.0
+
+    for k in range(w - 2, -1, -1):
+        started = time.perf_counter()
+        nxt = ext[(k + 1) % 2]
+        cur = ext[k % 2]
+        up = nxt[lo:hi]
+        straight = nxt[lo + 1:hi + 1]
+        down = nxt[lo + 2:hi + 2]
+
+        # Same tie-breaking as `tabulation`: up, then straight, then down
+        np.minimum(up, straight, out=best)
+        np.less(straight, up, out=to_straight)
+        np.less(down, best, out=to_down)
+        np.minimum(best, down, out=best)
+        np.add(A[lo:hi, k], best, out=cur[lo + 1:hi + 1])
+        np.multiply(to_down.view(np.int8), np.int8(DOWN), out=scratch)
+        np.maximum(to_straight.view(np.int8), scratch, out=moves[k, lo:hi])
+
+        if lo == 0:
+            cur[h + 1] = cur[1]
+        if hi == h:
+            cur[0] = cur[h]
+        synced = time.perf_counter()
+        barrier.wait()
+        busy += synced - started
+        waited += time.perf_counter() - synced
+
+    timing["busy_seconds"] = busy
+    timing["barrier_wait_seconds"] = waited
+
+
+def threaded(M, y=0, threads=None, stats=None):
+    """
+    Find optimal path with a column sweep whose rows are split over threads.
+
+    Each thread owns a contiguous shard of rows and runs the NumPy
+    min/add kernels for it, which release the GIL. Neighbouring shards
+    read each other's boundary rows (one-row halos, wrapping at the top
+    and bottom) from a shared cost column, with one barrier per column.
+    Same recurrence, tie-breaking and paths as `tabulation`. Meant for
+    very tall matrices; pass a Fortran-ordered ndarray to read columns
+    contiguously.
+
+    Args:
+        M: 2D list or ndarray representing the cost matrix
+        y: Starting row position (0-indexed)
+        threads: Number of row shards (default: os.cpu_count(), keeping
+                 at least 65536 rows per shard)
+        stats: Optional dict filled with 'threads', 'shard_rows' and the
+               per-thread 'busy_seconds' and 'barrier_wait_seconds'
+
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if len(M) == 0 or len(M[0]) == 0:
+        return []
+
+    A = _as_array(M)
+    h, w = A.shape
+    if threads is None:
+        threads = min(os.cpu_count() or 1, h // _MIN_SHARD_ROWS)
+    threads = max(1, min(threads, h))
+    shards = _shard_bounds(h, threads)
+
+    ext = np.empty((2, h + 2))
+    last = ext[(w - 1) % 2]
+    last[1:h + 1] = A[:, w - 1]
+    last[0] = last[h]
+    last[h + 1] = last[1]
+    moves = np.empty((w - 1, h), dtype=np.int8)
+
+    barrier = threading.Barrier(threads)
+    timings = [{} for _ in shards]
+    errors = []
+
+    def run(lo, hi, timing):
+        try:
+            _sweep_shard(A, ext, moves, lo, hi, barrier, timing)
+        except threading.BrokenBarrierError:
+            pass
+        except BaseException as error:
+            errors.append(error)
+            barrier.abort()
+
+    workers = [
+        threading.Thread(target=run, args=(lo, hi, timing), daemon=True)
+        for (lo, hi), timing in zip(shards, timings)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    if errors:
+        raise errors[0]
+
+    if stats is not None:
+        stats["threads"] = threads
+        stats["shard_rows"] = [hi - lo for lo, hi in shards]
+        stats["busy_seconds"] = [timing.get("busy_seconds", 0.0) for timing in timings]
+        stats["barrier_wait_seconds"] = [timing.get("barrier_wait_seconds", 0.0) for timing in timings]
+    return _follow_moves(moves, y)
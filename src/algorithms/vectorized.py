@@ -0,0 +1,323 @@
+"""Vectorized (NumPy column-sweep) dynamic programming for matrix crossing."""
+
+import math
+
+import numpy as np
+
+from .all_starts import all_starts_result
+
+# Moves stored per cell: next row is row - 1, row or row + 1 (toroidal)
+UP, STRAIGHT, DOWN = 0, 1, 2
+
+# Columns whose costs are buffered before moves are derived, capped so
+# each chunk buffer stays around _CHUNK_BYTES for very tall matrices
+_CHUNK_COLS = 1024
+_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def _as_array(M):
+    """Return the matrix as a float64 ndarray (no copy if already one)."""
+    return np.asarray(M, dtype=np.float64)
+
+
+class _ColumnSweep:
+    """
+    Right-to-left DP over the last axis of a cost array.
+
+    Cost columns are buffered per chunk, padded with their wrapped
+    neighbours so the up/straight/down candidates are plain views. Only
+    min/add run per column; moves are derived for the whole chunk at once.
+    Leading axes (e.g. a batch of matrices) are swept together.
+
+    With up to a few thousand rows the per-column cost is dominated by
+    NumPy call overhead, so the views of every buffered column are built
+    once and the move derivation reuses preallocated buffers.
+    """
+
+    def __init__(self, shape, chunk=_CHUNK_COLS):
+        h = self.h = shape[-1]
+        self.chunk = chunk
+        self.ext = np.empty((chunk + 1,) + tuple(shape[:-1]) + (h + 2,))
+        self.best = np.empty(shape)
+        self.lowest = np.empty((chunk,) + tuple(shape))
+        self.to_straight = np.empty((chunk,) + tuple(shape), dtype=np.bool_)
+        self.to_down = np.empty((chunk,) + tuple(shape), dtype=np.bool_)
+        # Per buffered column: up/straight/down candidates, cost slots,
+        # and the two pad cells with the cells they wrap to
+        wrapped = (lambda row: row[..., h:0:-(h - 1)]) if h > 1 else (lambda row: row[..., 1:2])
+        self.views = [
+            (row[..., :h], row[..., 1:h + 1], row[..., 2:], row[..., ::h + 1], wrapped(row))
+            for row in self.ext
+        ]
+
+    @property
+    def costs(self):
+        """Cost column of the leftmost column swept so far."""
+        return self.ext[-1, ..., 1:self.h + 1]
+
+    def load(self, costs):
+        """Set the cost column the next sweep builds on."""
+        _, slots, _, pads, wrapped = self.views[-1]
+        slots[...] = costs
+        np.copyto(pads, wrapped)
+
+    def sweep(self, columns, moves):
+        """
+        Sweep a block of columns, right to left.
+
+        Ties are broken like `tabulation`: up, then straight, then down.
+
+        Args:
+            columns: Matrix block with the columns on its last axis
+            moves: int8 array (n_cols, ..., h) receiving the chosen moves,
+                   or None to compute costs only
+        """
+        h = self.h
+        n = columns.shape[-1]
+        views = self.views[self.chunk - n:]
+        best = self.best
+        minimum = np.minimum
+        for k in range(n - 1, -1, -1):
+            up, straight, down = views[k + 1][:3]
+            _, slots, _, pads, wrapped = views[k]
+            minimum(up, straight, out=best)
+            minimum(best, down, out=best)
+            np.add(columns[..., k], best, out=slots)
+            np.copyto(pads, wrapped)
+
+        ext = self.ext[self.chunk - n:]
+        if moves is not None:
+            up = ext[1:, ..., :h]
+            straight = ext[1:, ..., 1:h + 1]
+            down = ext[1:, ..., 2:]
+            to_straight = self.to_straight[:n]
+            to_down = self.to_down[:n]
+            np.less(straight, up, out=to_straight)
+            lowest = self.lowest[:n]
+            np.minimum(up, straight, out=lowest)
+            np.less(down, lowest, out=to_down)
+            to_down = to_down.view(np.int8)
+            np.left_shift(to_down, 1, out=to_down)  # DOWN == 2
+            np.maximum(to_straight.view(np.int8), to_down, out=moves)
+        self.ext[-1] = ext[0]
+
+
+def _chunk_cols(shape):
+    """Columns per chunk for a column of the given shape."""
+    cells = int(np.prod(shape))
+    return max(1, min(_CHUNK_COLS, _CHUNK_BYTES // (8 * cells)))
+
+
+def _pack_moves(moves):
+    """Pack moves along the last axis, 2 bits per row (4 rows per byte)."""
+    h = moves.shape[-1]
+    padded = np.zeros(moves.shape[:-1] + ((h + 3) // 4 * 4,), dtype=np.uint8)
+    padded[..., :h] = moves
+    quads = padded.reshape(moves.shape[:-1] + (-1, 4))
+    return quads[..., 0] | (quads[..., 1] << 2) | (quads[..., 2] << 4) | (quads[..., 3] << 6)
+
+
+def _packed_moves_shape(w, h):
+    """Shape of the packed move table for a matrix of h rows and w columns."""
+    return (w - 1, (h + 3) // 4)
+
+
+def _sweep_range(sweep, A, start, end, moves=None, block=None):
+    """
+    Sweep columns [start, end) right to left, one chunk at a time.
+
+    Args:
+        sweep: _ColumnSweep loaded with the costs of column `end`
+        A: Matrix array with the columns on its last axis
+        start, end: Column range to sweep
+        moves: Move table indexed from `start`, or None for costs only
+        block: int8 scratch chunk; if given, `moves` is a packed table
+    """
+    for stop in range(end, start, -sweep.chunk):
+        first = max(start, stop - sweep.chunk)
+        columns = A[..., first:stop]
+        if moves is None:
+            sweep.sweep(columns, None)
+        elif block is not None:
+            sweep.sweep(columns, block[:stop - first])
+            moves[first - start:stop - start] = _pack_moves(block[:stop - first])
+        else:
+            sweep.sweep(columns, moves[first - start:stop - start])
+
+
+def _sweep(A, moves, packed=False):
+    """
+    Run the full right-to-left sweep, filling `moves`.
+
+    Args:
+        A: Matrix array with the columns on its last axis
+        moves: int8 move table (n_cols - 1, ..., h), or the packed uint8
+               table from `_packed_moves_shape` if `packed`
+        packed: Store moves with 2 bits per cell
+
+    Returns:
+        Cost column 0 (minimum crossing cost from every start row)
+    """
+    w = A.shape[-1]
+    chunk = _chunk_cols(A.shape[:-1])
+    sweep = _ColumnSweep(A.shape[:-1], chunk)
+    sweep.load(A[..., w - 1])
+    block = np.empty((chunk,) + A.shape[:-1], dtype=np.int8) if packed else None
+    _sweep_range(sweep, A, 0, w - 1, moves, block)
+    return sweep.costs.copy()
+
+
+def _follow_moves(moves, y):
+    """Rebuild a path of [col, row] pairs from a (w-1, h) move table."""
+    h = moves.shape[1]
+    row = y
+    path = [[0, row]]
+    for i in range(moves.shape[0]):
+        row = (row + moves[i].item(row) - 1) % h
+        path.append([i + 1, row])
+    return path
+
+
+def _follow_packed_moves(packed, y, h):
+    """Rebuild a path of [col, row] pairs from a packed move table."""
+    row = y
+    path = [[0, row]]
+    for i in range(packed.shape[0]):
+        move = (packed[i].item(row >> 2) >> ((row & 3) << 1)) & 3
+        row = (row + move - 1) % h
+        path.append([i + 1, row])
+    return path
+
+
+def vectorized(M, y=0):
+    """
+    Find optimal path using a NumPy column sweep (bottom-up DP).
+
+    Same recurrence and tie-breaking as `tabulation`, but every column is
+    computed with vectorized operations over all rows. Only one rolling
+    cost column is kept; the path is rebuilt from an int8 move table.
+
+    Args:
+        M: 2D list or ndarray representing the cost matrix
+        y: Starting row position (0-indexed)
+
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if len(M) == 0 or len(M[0]) == 0:
+        return []
+
+    A = _as_array(M)
+    moves = np.empty((A.shape[1] - 1, A.shape[0]), dtype=np.int8)
+    _sweep(A, moves)
+    return _follow_moves(moves, y)
+
+
+def vectorized_packed(M, y=0):
+    """
+    Find optimal path with a NumPy column sweep and a bit-packed move table.
+
+    Like `vectorized`, but each move (up/straight/down) takes 2 bits, so
+    besides one rolling cost column the only O(m x n) storage is m*n/4
+    bytes (tabulation keeps a Python float per cell). Same paths as
+    `tabulation`.
+
+    Args:
+        M: 2D list or ndarray representing the cost matrix
+        y: Starting row position (0-indexed)
+
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if len(M) == 0 or len(M[0]) == 0:
+        return []
+
+    A = _as_array(M)
+    h, w = A.shape
+    packed = np.empty(_packed_moves_shape(w, h), dtype=np.uint8)
+    _sweep(A, packed, packed=True)
+    return _follow_packed_moves(packed, y, h)
+
+
+def vectorized_checkpoint(M, y=0, interval=None):
+    """
+    Find optimal path with a NumPy column sweep and checkpointed recovery.
+
+    The first sweep keeps only every `interval`-th cost column. The path
+    is then rebuilt segment by segment, left to right: each segment is
+    swept again from its right checkpoint to get its moves. This costs
+    about twice the compute of `vectorized` but needs only
+    O(m * (n / interval + interval)) memory, i.e. O(m * sqrt(n)) with the
+    default interval. Same paths as `tabulation`.
+
+    Args:
+        M: 2D list or ndarray representing the cost matrix
+        y: Starting row position (0-indexed)
+        interval: Columns between stored cost columns (default ~sqrt(8n),
+                  balancing 8-byte checkpoints against 1-byte moves).
+                  Smaller values store more checkpoints; larger values
+                  keep longer move segments.
+
+    Returns:
+        List of [col, row] positions representing the optimal path
+    """
+    if len(M) == 0 or len(M[0]) == 0:
+        return []
+
+    A = _as_array(M)
+    h, w = A.shape
+    if interval is None:
+        interval = max(1, math.isqrt(8 * w))
+    bounds = list(range(0, w - 1, interval)) + [w - 1]
+
+    # Sweep once, keeping the cost column at every segment start
+    sweep = _ColumnSweep((h,), _chunk_cols((h,)))
+    sweep.load(A[:, w - 1])
+    checkpoints = {w - 1: A[:, w - 1].copy()}
+    for start, end in reversed(list(zip(bounds, bounds[1:]))):
+        _sweep_range(sweep, A, start, end)
+        if start > 0:
+            checkpoints[start] = sweep.costs.copy()
+
+    # Rebuild the path, recomputing the moves of one segment at a time
+    moves = np.empty((interval, h), dtype=np.int8)
+    path = [[0, y]]
+    row = y
+    for start, end in zip(bounds, bounds[1:]):
+        sweep.load(checkpoints.pop(end))
+        _sweep_range(sweep, A, start, end, moves)
+        for i in range(end - start):
+            row = (row + moves[i].item(row) - 1) % h
+            path.append([start + i + 1, row])
+    return path
+
+
+def vectorized_all_starts(M):
+    """
+    Solve from every start row with a single NumPy column sweep.
+
+    The move table is built once; the paths of all start rows are then
+    followed together, one vectorized step per column.
+
+    Args:
+        M: 2D list or ndarray representing the cost matrix
+
+    Returns:
+        Dict with per-start 'costs' and 'paths', plus 'best_start',
+        'best_cost' and 'best_path' for the global optimum
+    """
+    if len(M) == 0 or len(M[0]) == 0:
+        return all_starts_result([], [])
+
+    A = _as_array(M)
+    h, w = A.shape
+    moves = np.empty((w - 1, h), dtype=np.int8)
+    costs = _sweep(A, moves)
+
+    rows = np.empty((w, h), dtype=np.intp)
+    rows[0] = np.arange(h)
+    for i in range(w - 1):
+        rows[i + 1] = (rows[i] + moves[i, rows[i]] - 1) % h
+    paths = [[[col, row] for col, row in enumerate(start_rows)]
+             for start_rows in rows.T.tolist()]
+    return all_starts_result(costs.tolist(), paths)
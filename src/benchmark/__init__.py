@@ -1,9 +1,17 @@
 from .runner import BenchmarkRunner
 from .results import BenchmarkResult, save_results, load_results
+from .workers import WorkerPool
+from .repetition import RepetitionSettings
+from .journal import ResultJournal
+from .prediction import RuntimeModels
 
 __all__ = [
     "BenchmarkRunner",
     "BenchmarkResult",
     "save_results",
     "load_results",
+    "WorkerPool",
+    "RepetitionSettings",
+    "ResultJournal",
+    "RuntimeModels",
 ]
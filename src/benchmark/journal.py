@@ -0,0 +1,124 @@
+"""Append-only JSONL journal of benchmark results (crash-safe, resumable)."""
+
+import json
+import os
+from dataclasses import fields
+from typing import List, Optional, Tuple
+
+from .results import BenchmarkResult
+
+_RESULT_FIELDS = {f.name for f in fields(BenchmarkResult)}
+
+
+def job_key(
+    algorithm: str,
+    matrix_type: str,
+    start_position: int,
+    all_starts: bool = False
+) -> Tuple[str, str, Optional[int]]:
+    """
+    Identify a benchmark job.
+
+    All-starts jobs record the best start row as start_position, so their
+    key uses None instead.
+    """
+    return (algorithm, matrix_type, None if all_starts else start_position)
+
+
+class ResultJournal:
+    """
+    Append-only JSONL file with one BenchmarkResult per line.
+
+    Each result is written, flushed and fsynced as soon as it is
+    produced, so at most the job in progress is lost if the process dies.
+    A torn last line (crash mid-write) is cut off on load and before the
+    first append, so new results never land on the end of it.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Journal file path
+        """
+        self.path = path
+        self._tail_checked = False
+
+    def _truncate_torn_tail(self) -> None:
+        """Truncate the journal back to its last newline (drops a torn last line)."""
+        self._tail_checked = True
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                size = min(4096, position)
+                position -= size
+                f.seek(position)
+                newline = f.read(size).rfind(b"\n")
+                if newline >= 0:
+                    position += newline + 1
+                    break
+            if position < end:
+                f.truncate(position)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def append(self, result: BenchmarkResult) -> None:
+        """Write one result and force it to disk."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not self._tail_checked:
+            self._truncate_torn_tail()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def load(self) -> List[BenchmarkResult]:
+        """
+        Read every complete result in the journal.
+
+        A torn last line is truncated away first.
+
+        Returns:
+            Results in the order they were written (empty if no journal)
+        """
+        if not os.path.exists(self.path):
+            return []
+        self._truncate_torn_tail()
+        results = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn write from a crash
+                results.append(BenchmarkResult(
+                    **{k: v for k, v in data.items() if k in _RESULT_FIELDS}
+                ))
+        return results
+
+    def rotate(self) -> Optional[str]:
+        """
+        Move an existing journal aside instead of deleting it.
+
+        Returns:
+            Path of the backup (`<journal>.bak`, or `<journal>.<n>.bak` if
+            that one exists), or None if there was no journal
+        """
+        if not os.path.exists(self.path):
+            return None
+        backup = self.path + ".bak"
+        n = 1
+        while os.path.exists(backup):
+            backup = f"{self.path}.{n}.bak"
+            n += 1
+        os.replace(self.path, backup)
+        return backup
+
+    def clear(self) -> None:
+        """Delete the journal file."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,226 @@
+"""Per-algorithm runtime models fitted from past benchmark results."""
+
+import json
+import math
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .results import BenchmarkResult
+
+# Engines that enumerate paths: runtime grows like 3^cols
+EXPONENTIAL_ALGORITHMS = {
+    "brute_force", "brute_force_iterative", "backtracking",
+    "backtracking_bounded", "backtracking_iterative", "divide_and_conquer",
+    "parallel_brute_force", "parallel_divide_and_conquer", "parallel_backtracking",
+}
+
+TIMEOUT_SAFETY_FACTOR = 10.0  # Timeout = predicted runtime x this factor...
+MIN_TIMEOUT_SECONDS = 10.0  # ...but never below process startup noise
+MAX_TIMEOUT_SECONDS = 240.0  # ...nor above the largest get_adaptive_timeout step
+OUT_OF_REACH_FACTOR = 4.0  # Skip jobs predicted to take this many times their budget
+MAX_OBSERVATIONS = 500  # Per algorithm and mode; the oldest are dropped
+
+# How execution_time_seconds was measured; each mode has its own models
+MEASUREMENT_MODES = ("new_process", "warm_worker", "repeated", "autorange")
+# Modes whose execution_time_seconds includes the process round trip
+PROCESS_TIMED_MODES = ("new_process", "warm_worker")
+
+
+def model_family(algorithm: str) -> str:
+    """
+    Runtime model used for an algorithm.
+
+    Returns:
+        'exponential' (log t linear in cols) for the exhaustive engines,
+        'power' (log t linear in log(rows * cols)) for everything else
+    """
+    return "exponential" if algorithm in EXPONENTIAL_ALGORITHMS else "power"
+
+
+def _feature(family: str, rows: int, cols: int) -> float:
+    if family == "exponential":
+        return float(cols)
+    return math.log(rows * cols)
+
+
+def fit_log_linear(points: List[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    """
+    Least-squares fit of log(seconds) = intercept + slope * x.
+
+    The slope is clamped at 0: runtime never shrinks with size.
+
+    Args:
+        points: (x, seconds) pairs with seconds > 0
+
+    Returns:
+        (intercept, slope), or None with fewer than two distinct x
+    """
+    if len({x for x, _ in points}) < 2:
+        return None
+    xs = [x for x, _ in points]
+    ys = [math.log(seconds) for _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = max(0.0, sxy / sxx)
+    return mean_y - slope * mean_x, slope
+
+
+def _fit(algorithm: str, observations: List[List]) -> Optional[Tuple[str, float, float]]:
+    """Fit (family, intercept, slope) on the completed runs among the observations."""
+    family = model_family(algorithm)
+    points = [
+        (_feature(family, rows, cols), seconds)
+        for rows, cols, seconds, timed_out in observations
+        if not timed_out
+    ]
+    coefficients = fit_log_linear(points)
+    if coefficients is None:
+        return None
+    return (family,) + coefficients
+
+
+class RuntimeModels:
+    """
+    Runtime models of every algorithm, persisted as one JSON file.
+
+    Each algorithm keeps its observations (rows, cols, seconds,
+    timed_out); the model is refitted from them on every prediction, so
+    each new result refines it. Completed runs are fitted; timed-out runs
+    are lower bounds for their size and every larger one.
+
+    In the process-timed modes completed runs are fitted on the
+    child-side `algorithm_wall_seconds`: the fixed spawn and transfer
+    cost would otherwise dominate small sizes and flatten the slope.
+
+    Process wall times, repetition medians and autorange per-call times
+    are not comparable, so the file keeps separate models per
+    measurement mode and an instance only reads and updates its own.
+    """
+
+    def __init__(self, path: str, mode: str = "new_process"):
+        """
+        Args:
+            path: JSON file with the models (created on first save)
+            mode: Measurement mode of the results (see MEASUREMENT_MODES)
+        """
+        if mode not in MEASUREMENT_MODES:
+            raise ValueError(f"Unknown measurement mode: {mode}. Available: {list(MEASUREMENT_MODES)}")
+        self.path = path
+        self.mode = mode
+        self._models: Dict[str, Dict[str, List[List]]] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for saved_mode, models in data.get("models", {}).items():
+                self._models[saved_mode] = {
+                    algorithm: model["observations"] for algorithm, model in models.items()
+                }
+        self.observations: Dict[str, List[List]] = self._models.setdefault(mode, {})
+
+    def observe(self, result: BenchmarkResult) -> bool:
+        """
+        Add a result as an observation.
+
+        Skipped, failed and all-starts jobs are ignored.
+
+        Returns:
+            True if the result was used
+        """
+        if result.skipped or result.all_starts or result.execution_time_seconds <= 0:
+            return False
+        if result.error_message and not result.timed_out:
+            return False
+        seconds = result.execution_time_seconds
+        if (self.mode in PROCESS_TIMED_MODES and not result.timed_out
+                and result.algorithm_wall_seconds):
+            seconds = result.algorithm_wall_seconds
+        observations = self.observations.setdefault(result.algorithm, [])
+        observations.append([result.matrix_rows, result.matrix_cols, seconds, result.timed_out])
+        del observations[:-MAX_OBSERVATIONS]
+        return True
+
+    def fit(self, algorithm: str) -> Optional[Tuple[str, float, float]]:
+        """
+        Fit the model of an algorithm on its completed runs.
+
+        Returns:
+            (family, intercept, slope), or None without enough data
+        """
+        return _fit(algorithm, self.observations.get(algorithm, []))
+
+    def predict(self, algorithm: str, rows: int, cols: int) -> Optional[float]:
+        """
+        Predict the runtime of one run on a rows x cols matrix.
+
+        Returns:
+            Seconds (at least any timeout seen at this size or smaller),
+            or None if the algorithm has no model yet
+        """
+        model = self.fit(algorithm)
+        if model is None:
+            return None
+        family, intercept, slope = model
+        predicted = math.exp(intercept + slope * _feature(family, rows, cols))
+        for obs_rows, obs_cols, seconds, timed_out in self.observations[algorithm]:
+            if timed_out and obs_rows <= rows and obs_cols <= cols:
+                predicted = max(predicted, seconds)
+        return predicted
+
+    def covers(self, algorithm: str, rows: int, cols: int) -> bool:
+        """Check whether a completed run at least this large backs the model (interpolation)."""
+        return any(
+            obs_rows >= rows and obs_cols >= cols and not timed_out
+            for obs_rows, obs_cols, _, timed_out in self.observations.get(algorithm, [])
+        )
+
+    def timeout_for(self, algorithm: str, rows: int, cols: int) -> Optional[float]:
+        """
+        Per-run timeout from the predicted runtime.
+
+        Returns:
+            Seconds in [MIN_TIMEOUT_SECONDS, MAX_TIMEOUT_SECONDS], or None
+            if the algorithm has no model yet
+        """
+        predicted = self.predict(algorithm, rows, cols)
+        if predicted is None:
+            return None
+        return min(max(predicted * TIMEOUT_SAFETY_FACTOR, MIN_TIMEOUT_SECONDS), MAX_TIMEOUT_SECONDS)
+
+    def out_of_reach(
+        self,
+        algorithm: str,
+        rows: int,
+        cols: int,
+        budget: float = MAX_TIMEOUT_SECONDS
+    ) -> bool:
+        """
+        Check whether a run is predicted to take far longer than its budget.
+
+        Args:
+            budget: Seconds the run may take (default: the per-run cap)
+        """
+        predicted = self.predict(algorithm, rows, cols)
+        return predicted is not None and predicted > OUT_OF_REACH_FACTOR * budget
+
+    def save(self) -> None:
+        """Write the models of every mode atomically (observations and current fit)."""
+        models = {}
+        for mode, mode_observations in sorted(self._models.items()):
+            models[mode] = {}
+            for algorithm, observations in sorted(mode_observations.items()):
+                model = _fit(algorithm, observations)
+                models[mode][algorithm] = {
+                    "family": model_family(algorithm),
+                    "intercept": model[1] if model else None,
+                    "slope": model[2] if model else None,
+                    "observations": observations,
+                }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"models": models}, f, indent=2)
+        os.replace(tmp_path, self.path)
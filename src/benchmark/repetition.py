@@ -0,0 +1,70 @@
+"""Repetition settings and robust statistics for repeated timings."""
+
+import math
+import statistics
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+
+@dataclass
+class RepetitionSettings:
+    """How many times each benchmark job is repeated."""
+    warmup: int = 1  # Discarded runs per job before sampling (the first one records path and memory)
+    min_samples: int = 5  # Samples required before checking convergence
+    max_samples: int = 50  # Hard cap on samples per job
+    target_relative_ci: float = 0.05  # Stop when the median CI half-width <= this fraction of the median
+    job_budget_seconds: float = 30.0  # Wall-clock budget per job (warm-up included)
+
+
+def median_confidence_interval(samples: List[float], z: float = 1.96) -> Tuple[float, float]:
+    """
+    Distribution-free confidence interval of the median.
+
+    Uses the order statistics at ranks n/2 -+ z*sqrt(n)/2 (normal
+    approximation of the binomial), clamped to the sample range.
+
+    Args:
+        samples: Timing samples (at least one)
+        z: Normal quantile of the confidence level (1.96 = 95%)
+
+    Returns:
+        (lower, upper) bounds of the interval
+    """
+    ordered = sorted(samples)
+    n = len(ordered)
+    spread = z * math.sqrt(n) / 2
+    lower = max(1, math.floor(n / 2 - spread))
+    upper = min(n, math.ceil(1 + n / 2 + spread))
+    return ordered[lower - 1], ordered[upper - 1]
+
+
+def has_converged(samples: List[float], settings: RepetitionSettings) -> bool:
+    """Check whether the median CI is tight enough to stop sampling."""
+    if len(samples) < settings.min_samples:
+        return False
+    lower, upper = median_confidence_interval(samples)
+    return (upper - lower) / 2 <= settings.target_relative_ci * statistics.median(samples)
+
+
+def summarize_samples(samples: List[float]) -> Dict[str, Any]:
+    """
+    Median, interquartile range, minimum and count of timing samples.
+
+    Args:
+        samples: Timing samples (at least one)
+
+    Returns:
+        Dict with 'median_seconds', 'iqr_seconds', 'min_seconds'
+        and 'sample_count'
+    """
+    if len(samples) > 1:
+        q1, _, q3 = statistics.quantiles(samples, n=4)
+        iqr = q3 - q1
+    else:
+        iqr = 0.0
+    return {
+        "median_seconds": statistics.median(samples),
+        "iqr_seconds": iqr,
+        "min_seconds": min(samples),
+        "sample_count": len(samples),
+    }
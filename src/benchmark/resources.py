@@ -0,0 +1,204 @@
+"""Process resource usage: peak RSS, CPU times and context switches."""
+
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+try:
+    _PAGE_KB = os.sysconf("SC_PAGE_SIZE") / 1024
+except (AttributeError, ValueError, OSError):
+    _PAGE_KB = 4.0
+
+
+def read_proc_status(pid: Optional[int] = None) -> Dict[str, int]:
+    """
+    Read the numeric fields of /proc/<pid>/status (Linux only).
+
+    Args:
+        pid: Process id (None = this process)
+
+    Returns:
+        Dict of field name to integer value (memory fields in KB), or an
+        empty dict if /proc is not available or the process is gone
+    """
+    path = f"/proc/{pid}/status" if pid is not None else "/proc/self/status"
+    fields = {}
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                parts = value.split()
+                if parts and parts[0].isdigit():
+                    fields[name] = int(parts[0])
+    except OSError:
+        return {}
+    return fields
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset this process's peak RSS (VmHWM) to its current RSS.
+
+    Lets a reused worker report the peak of each job instead of the
+    peak of its whole life. Linux only; harmless elsewhere.
+
+    Returns:
+        True if the high-water mark was reset
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _maxrss_kb(usage) -> float:
+    """ru_maxrss in KB (it is reported in bytes on macOS)."""
+    if sys.platform == "darwin":
+        return usage.ru_maxrss / 1024
+    return float(usage.ru_maxrss)
+
+
+def peak_rss_kb(pid: Optional[int] = None) -> Optional[float]:
+    """
+    Peak resident set size of a process, in KB.
+
+    Uses VmHWM from /proc/<pid>/status, falling back to ru_maxrss for
+    this process. Child processes are not included (see
+    `children_peak_rss_kb`).
+
+    Args:
+        pid: Process id (None = this process)
+
+    Returns:
+        Peak RSS in KB, or None if it cannot be read
+    """
+    hwm = read_proc_status(pid).get("VmHWM")
+    if hwm is not None:
+        return float(hwm)
+    if pid is not None or resource is None:
+        return None
+    return _maxrss_kb(resource.getrusage(resource.RUSAGE_SELF))
+
+
+def children_peak_rss_kb() -> Optional[float]:
+    """
+    Largest peak RSS among the waited-for child processes of this process, in KB.
+
+    This is ru_maxrss of RUSAGE_CHILDREN: a high-water mark over the
+    process's whole life that `reset_peak_rss` does not clear, so it
+    only describes one job in a process forked for that job.
+
+    Returns:
+        Peak RSS in KB (0 if no child was waited for), or None without
+        the `resource` module
+    """
+    if resource is None:
+        return None
+    return _maxrss_kb(resource.getrusage(resource.RUSAGE_CHILDREN))
+
+
+def usage_snapshot() -> Optional[Dict[str, float]]:
+    """
+    CPU times and context switches of this process and its waited-for children.
+
+    Returns:
+        Dict with 'user', 'system', 'voluntary' and 'involuntary'
+        totals, or None without the `resource` module
+    """
+    if resource is None:
+        return None
+    totals = {"user": 0.0, "system": 0.0, "voluntary": 0, "involuntary": 0}
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        totals["user"] += usage.ru_utime
+        totals["system"] += usage.ru_stime
+        totals["voluntary"] += usage.ru_nvcsw
+        totals["involuntary"] += usage.ru_nivcsw
+    return totals
+
+
+def collect_resources(start: Optional[Dict[str, float]]) -> Dict[str, Any]:
+    """
+    Resource usage since `start` (a `usage_snapshot`), plus the peak RSS.
+
+    Args:
+        start: Snapshot taken before the measured work
+
+    Returns:
+        Dict with 'peak_rss_kb', 'user_cpu_seconds', 'system_cpu_seconds',
+        'voluntary_ctx_switches' and 'involuntary_ctx_switches' (None
+        where the platform does not provide them)
+    """
+    end = usage_snapshot()
+    collected = {
+        "peak_rss_kb": peak_rss_kb(),
+        "user_cpu_seconds": None,
+        "system_cpu_seconds": None,
+        "voluntary_ctx_switches": None,
+        "involuntary_ctx_switches": None,
+    }
+    if start is not None and end is not None:
+        collected["user_cpu_seconds"] = end["user"] - start["user"]
+        collected["system_cpu_seconds"] = end["system"] - start["system"]
+        collected["voluntary_ctx_switches"] = end["voluntary"] - start["voluntary"]
+        collected["involuntary_ctx_switches"] = end["involuntary"] - start["involuntary"]
+    return collected
+
+
+def read_rss_kb(pid: int) -> Optional[float]:
+    """
+    Current resident set size of a process from /proc/<pid>/statm, in KB.
+
+    Args:
+        pid: Process id
+
+    Returns:
+        RSS in KB, or None if /proc is not available or the process is gone
+    """
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * _PAGE_KB
+
+
+def wait_sampling_rss(
+    wait: Callable[[float], bool],
+    pid: int,
+    timeout: float,
+    interval: float,
+    timeline: List[List[float]]
+) -> bool:
+    """
+    Wait for a process in `interval` steps, sampling its RSS before each step.
+
+    Args:
+        wait: Blocks up to the given seconds; returns True once finished
+        pid: Process whose RSS is sampled
+        timeout: Total seconds to wait
+        interval: Seconds between samples
+        timeline: Receives [elapsed_seconds, rss_kb] pairs
+
+    Returns:
+        True if the process finished within `timeout`
+    """
+    start = time.perf_counter()
+    while True:
+        elapsed = time.perf_counter() - start
+        rss_kb = read_rss_kb(pid)
+        if rss_kb:  # 0 once the process has exited (zombie)
+            timeline.append([round(elapsed, 4), rss_kb])
+        remaining = timeout - elapsed
+        if remaining <= 0:
+            return wait(0)
+        if wait(min(interval, remaining)):
+            return True
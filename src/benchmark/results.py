@@ -24,6 +24,28 @@ class BenchmarkResult:
     timed_out: bool = False  # True if benchmark exceeded timeout
     error_message: Optional[str] = None  # Error description if any
     peak_memory_kb: Optional[float] = None  # Peak memory usage in KB (2 decimal precision)
+    all_starts: bool = False  # True if every start row was solved in this job (start_position = best row)
+    algorithm_stats: Optional[Dict[str, Any]] = None  # Counters reported by the algorithm (e.g. nodes expanded)
+    algorithm_wall_seconds: Optional[float] = None  # Algorithm call only, timed inside the child (perf_counter_ns)
+    algorithm_cpu_seconds: Optional[float] = None  # CPU time of that call in the child (process_time_ns)
+    orchestration_overhead_seconds: Optional[float] = None  # execution_time_seconds not spent in algorithm calls
+    samples: Optional[List[float]] = None  # Repetition mode: algorithm_wall_seconds of every timed repeat
+    median_seconds: Optional[float] = None  # Repetition mode: median of samples (also in execution_time_seconds)
+    iqr_seconds: Optional[float] = None  # Repetition mode: interquartile range of samples
+    min_seconds: Optional[float] = None  # Repetition mode: fastest sample
+    sample_count: Optional[int] = None  # Repetition mode: number of samples
+    autorange_loops: Optional[int] = None  # Autorange mode: calls in the measured loop (time is per call)
+    peak_rss_kb: Optional[float] = None  # Peak resident memory of the run's process (VmHWM / ru_maxrss), incl. NumPy
+    children_peak_rss_kb: Optional[float] = None  # Largest peak RSS of the run's child processes (new-process mode only)
+    user_cpu_seconds: Optional[float] = None  # User CPU time of the run (process + waited-for children)
+    system_cpu_seconds: Optional[float] = None  # System CPU time of the run
+    voluntary_ctx_switches: Optional[int] = None  # Voluntary context switches during the run
+    involuntary_ctx_switches: Optional[int] = None  # Involuntary context switches during the run
+    memory_timeline: Optional[List[List[float]]] = None  # [elapsed_seconds, rss_kb] samples taken by the parent
+    skipped: bool = False  # True if the job was not run (see skip_reason)
+    skip_reason: Optional[str] = None  # 'predicted_timeout' (smaller size timed out / runtime model) or 'budget' (global budget exhausted)
+    predicted_seconds: Optional[float] = None  # Runtime predicted by the runtime model before the run
+    timeout_seconds: Optional[float] = None  # Per-run limit applied (adaptive step, model-based or explicit)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -77,7 +99,13 @@ def save_results(
         fieldnames = [
             "algorithm", "matrix_type", "matrix_rows", "matrix_cols",
             "start_position", "execution_time_seconds", "path_cost",
-            "timestamp", "instance_id", "timed_out", "error_message", "peak_memory_kb"
+            "timestamp", "instance_id", "timed_out", "error_message", "peak_memory_kb",
+            "all_starts", "algorithm_wall_seconds", "algorithm_cpu_seconds",
+            "orchestration_overhead_seconds", "median_seconds", "iqr_seconds",
+            "min_seconds", "sample_count", "autorange_loops", "peak_rss_kb",
+            "children_peak_rss_kb", "user_cpu_seconds", "system_cpu_seconds",
+            "voluntary_ctx_switches", "involuntary_ctx_switches", "skipped",
+            "skip_reason", "predicted_seconds", "timeout_seconds"
         ]
         
         with open(filepath, "w", newline="", encoding="utf-8") as f:
@@ -87,6 +115,9 @@ def save_results(
             for r in results:
                 row = r.to_dict()
                 row.pop("path")  # Don't include path in CSV (too long)
+                row.pop("algorithm_stats")  # Nested counters, JSON only
+                row.pop("samples")  # Raw repetition samples, JSON only
+                row.pop("memory_timeline")  # RSS time series, JSON only
                 writer.writerow(row)
     
     else:
@@ -2,32 +2,125 @@
 
 import time
 import os
+import gc
+import inspect
+import signal
+import threading
 import tracemalloc
+from functools import partial
 from multiprocessing import Process, Queue
+from queue import Empty
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 
-from ..algorithms import ALGORITHMS
+from ..algorithms import (
+    ALGORITHMS, ALL_STARTS_ALGORITHMS, PROCESS_POOL_ALGORITHMS, solve_each_start
+)
 from ..matrix.presets import get_matrix_by_preset, MATRIX_PRESETS
 from ..matrix.generators import matrix_random
 from .results import BenchmarkResult, save_results
+from .workers import (
+    WorkerPool, WorkerTimeout, WorkerCrashed, kill_process_group, start_process_group
+)
+from .repetition import RepetitionSettings, has_converged, summarize_samples
+from .journal import ResultJournal, job_key
+from .prediction import RuntimeModels
+from .resources import (
+    children_peak_rss_kb, collect_resources, peak_rss_kb, reset_peak_rss, usage_snapshot, wait_sampling_rss
+)
 
 
-def run_algorithm_in_process(queue: Queue, algorithm: Callable, matrix: List[List[float]], start_position: int) -> None:
+def algorithm_accepts_stats(algorithm: Callable) -> bool:
+    """Check whether an algorithm reports counters through a `stats` dict."""
+    try:
+        return "stats" in inspect.signature(algorithm).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _call_algorithm(
+    algorithm: Callable,
+    matrix: List[List[float]],
+    start_position: int,
+    all_starts: bool
+) -> Dict[str, Any]:
+    """Call the algorithm once, timing only the call itself."""
+    stats = None
+    wall_start = time.perf_counter_ns()
+    cpu_start = time.process_time_ns()
+    if all_starts:
+        solution = algorithm(matrix)
+    elif algorithm_accepts_stats(algorithm):
+        stats = {}
+        solution = algorithm(matrix, start_position, stats=stats)
+    else:
+        solution = algorithm(matrix, start_position)
+    cpu_end = time.process_time_ns()
+    wall_end = time.perf_counter_ns()
+    
+    if all_starts:
+        path = solution["best_path"]
+        start_position = solution["best_start"]
+    else:
+        path = solution
+    return {
+        "path": path,
+        "start_position": start_position,
+        "algorithm_stats": stats,
+        "algorithm_wall_seconds": (wall_end - wall_start) / 1e9,
+        "algorithm_cpu_seconds": (cpu_end - cpu_start) / 1e9
+    }
+
+
+def execute_algorithm(
+    algorithm: Callable,
+    matrix: List[List[float]],
+    start_position: int,
+    all_starts: bool = False,
+    separate_memory_run: bool = False,
+    measure_memory: bool = True
+) -> Dict[str, Any]:
     """
-    Run algorithm in a separate process for memory measurement.
+    Run algorithm and measure its time and peak memory (runs inside the child process).
     
     Args:
-        queue: Queue to put results
         algorithm: Algorithm function to run
         matrix: Cost matrix
         start_position: Starting position
+        all_starts: Algorithm is an all-starts solver; report its global
+                    optimum and the start row it begins at
+        separate_memory_run: Time an untraced call, then measure peak
+                             memory in a second call under tracemalloc
+                             (otherwise the timed call is traced)
+        measure_memory: Trace memory at all; if False a single untraced
+                        call is made and 'peak_memory_kb' is None
+    
+    Returns:
+        Dict with 'path', 'error', 'peak_memory_kb', 'start_position',
+        'algorithm_stats', 'algorithm_wall_seconds', 'algorithm_cpu_seconds'
+        and 'child_seconds' (wall time of every algorithm call made), plus
+        the process resource usage from `collect_resources`
     """
     try:
+        # Real process usage (peak RSS includes NumPy buffers)
+        reset_peak_rss()
+        usage_start = usage_snapshot()
+        
+        if not measure_memory:
+            result = _call_algorithm(algorithm, matrix, start_position, all_starts)
+            result["child_seconds"] = result["algorithm_wall_seconds"]
+            result["error"] = None
+            result["peak_memory_kb"] = None
+            result.update(collect_resources(usage_start))
+            return result
+        
+        if separate_memory_run:
+            result = _call_algorithm(algorithm, matrix, start_position, all_starts)
+        
         # Start memory tracing
         tracemalloc.start()
         
-        path = algorithm(matrix, start_position)
+        traced = _call_algorithm(algorithm, matrix, start_position, all_starts)
         
         # Get peak memory usage
         current, peak = tracemalloc.get_traced_memory()
@@ -36,22 +129,182 @@ def run_algorithm_in_process(queue: Queue, algorithm: Callable, matrix: List[Lis
         # Stop memory tracing
         tracemalloc.stop()
         
-        queue.put({
-            "path": path, 
-            "error": None, 
-            "peak_memory_kb": peak_memory_kb
-        })
+        if separate_memory_run:
+            result["child_seconds"] = (
+                result["algorithm_wall_seconds"] + traced["algorithm_wall_seconds"]
+            )
+        else:
+            result = traced
+            result["child_seconds"] = traced["algorithm_wall_seconds"]
+        result["error"] = None
+        result["peak_memory_kb"] = peak_memory_kb
+        result.update(collect_resources(usage_start))
+        return result
     except Exception as e:
         # Make sure to stop tracemalloc even if there's an error
         try:
             tracemalloc.stop()
         except:
             pass
-        queue.put({
+        return {
             "path": None, 
             "error": str(e), 
             "peak_memory_kb": None
-        })
+        }
+
+
+def run_algorithm_in_process(
+    queue: Queue,
+    algorithm: Callable,
+    matrix: List[List[float]],
+    start_position: int,
+    all_starts: bool = False,
+    separate_memory_run: bool = False,
+    measure_memory: bool = True
+) -> None:
+    """
+    Run algorithm in a separate process for memory measurement.
+    
+    The process is forked for this job only, so it also reports
+    'children_peak_rss_kb' (e.g. the largest process-pool worker).
+    
+    Args:
+        queue: Queue to put results
+        algorithm: Algorithm function to run
+        matrix: Cost matrix
+        start_position: Starting position
+        all_starts, separate_memory_run, measure_memory: See `execute_algorithm`
+    """
+    start_process_group()  # So a timeout also kills pools the algorithm starts
+    result = execute_algorithm(
+        algorithm, matrix, start_position, all_starts, separate_memory_run, measure_memory
+    )
+    result["children_peak_rss_kb"] = children_peak_rss_kb()
+    queue.put(result)
+
+
+class AutorangeTimeout(Exception):
+    """An in-process autorange measurement exceeded its timeout."""
+
+
+def autorange_algorithm(
+    algorithm: Callable,
+    matrix: List[List[float]],
+    start_position: int,
+    all_starts: bool = False,
+    min_seconds: float = 0.2,
+    timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Time an algorithm in-process with a timeit-style autorange loop.
+    
+    One checked call under tracemalloc records the path, peak memory,
+    stats and resource usage (peak RSS is that of the whole process). The algorithm is then called in loops of 1, 2, 5, 10, 20, ...
+    calls, with the GC disabled, until one loop lasts `min_seconds`; the
+    per-call time of that loop is reported.
+    
+    The timeout is enforced with SIGALRM when running in the main thread
+    (it interrupts the algorithm between bytecodes). Elsewhere a watchdog
+    thread flags the deadline, which is checked between calls.
+    
+    Args:
+        algorithm: Algorithm function to run
+        matrix: Cost matrix
+        start_position: Starting position
+        all_starts: See `execute_algorithm`
+        min_seconds: Minimum duration of the measured loop
+        timeout: Seconds for the whole measurement (None = no limit)
+    
+    Returns:
+        Same dict as `execute_algorithm` (without 'child_seconds'), with
+        per-call 'algorithm_wall_seconds'/'algorithm_cpu_seconds' and the
+        number of calls in 'autorange_loops'
+    
+    Raises:
+        AutorangeTimeout: The measurement exceeded `timeout`
+    """
+    expired = threading.Event()
+    use_alarm = (
+        timeout is not None
+        and hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    watchdog = None
+    if use_alarm:
+        def on_alarm(signum, frame):
+            raise AutorangeTimeout(f"Timeout after {timeout}s")
+        previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    elif timeout is not None:
+        watchdog = threading.Timer(timeout, expired.set)
+        watchdog.daemon = True
+        watchdog.start()
+    gc_was_enabled = gc.isenabled()
+    
+    try:
+        # Checked call: path, stats, peak memory and resource usage
+        reset_peak_rss()
+        usage_start = usage_snapshot()
+        tracemalloc.start()
+        try:
+            result = _call_algorithm(algorithm, matrix, start_position, all_starts)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result.update(collect_resources(usage_start))
+        
+        if all_starts:
+            call = partial(algorithm, matrix)
+        else:
+            call = partial(algorithm, matrix, start_position)
+        
+        gc.disable()
+        scale = 1
+        while True:
+            for multiplier in (1, 2, 5):
+                number = multiplier * scale
+                wall_start = time.perf_counter_ns()
+                cpu_start = time.process_time_ns()
+                for _ in range(number):
+                    call()
+                    if expired.is_set():
+                        raise AutorangeTimeout(f"Timeout after {timeout}s")
+                cpu_end = time.process_time_ns()
+                wall_end = time.perf_counter_ns()
+                if (wall_end - wall_start) / 1e9 >= min_seconds:
+                    result["algorithm_wall_seconds"] = (wall_end - wall_start) / 1e9 / number
+                    result["algorithm_cpu_seconds"] = (cpu_end - cpu_start) / 1e9 / number
+                    result["autorange_loops"] = number
+                    result["error"] = None
+                    result["peak_memory_kb"] = peak / 1024
+                    return result
+            scale *= 10
+    except AutorangeTimeout:
+        raise
+    except Exception as e:
+        return {
+            "path": None,
+            "error": str(e),
+            "peak_memory_kb": None
+        }
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        elif watchdog is not None:
+            watchdog.cancel()
+        if gc_was_enabled:
+            gc.enable()
+
+
+# Seconds between liveness checks of a new-process run waiting for its result
+_RESULT_POLL_SECONDS = 0.1
+
+# Progress-line reason of a skipped job, by skip_reason
+_SKIP_MESSAGES = {
+    "budget": "presupuesto agotado",
+    "predicted_timeout": "timeout previsto por el modelo",
+}
 
 
 def calculate_path_cost(matrix: List[List[float]], path: List[List[int]]) -> float:
@@ -135,7 +388,18 @@ class BenchmarkRunner:
         instance_id: Optional[str] = None,
         output_dir: str = "./results",
         timeout_seconds: float = 60.0,  # 1 minute default
-        matrices_dir: Optional[str] = None  # Directory with pre-generated matrices
+        matrices_dir: Optional[str] = None,  # Directory with pre-generated matrices
+        algorithm_options: Optional[Dict[str, Any]] = None,
+        warm_workers: bool = False,
+        separate_memory_run: bool = False,
+        repetition: Optional[RepetitionSettings] = None,
+        autorange: bool = False,
+        autorange_min_seconds: float = 0.2,
+        memory_sample_interval: Optional[float] = None,
+        journal: bool = True,
+        resume: bool = False,
+        time_budget_seconds: Optional[float] = None,
+        runtime_models_path: Optional[str] = None
     ):
         """
         Initialize benchmark runner.
@@ -146,18 +410,121 @@ class BenchmarkRunner:
             instance_id: EC2 instance identifier (optional)
             output_dir: Directory for output files
             timeout_seconds: Maximum time allowed per benchmark (default: 300s)
+            algorithm_options: Extra keyword arguments for the algorithm
+                               (e.g. {"interval": 100} for vectorized_checkpoint)
+            warm_workers: Run jobs in a persistent pre-started worker instead
+                          of spawning a process per run (call `close()` when done)
+            separate_memory_run: Time the algorithm without tracemalloc and
+                                 measure peak memory in a second traced call
+                                 (the timeout covers both calls)
+            repetition: Repeat every preset/complexity job with warm-up and
+                        adaptive sample counts (see `run_repeated`). Implies
+                        warm_workers (unless autorange): warm-up runs in a
+                        fresh process per run would warm nothing
+            autorange: Measure in-process with `autorange_algorithm` (no
+                       subprocess); execution_time_seconds is the per-call time.
+                       Not available for process-pool engines unless
+                       algorithm_options sets workers=1: the timeout
+                       cannot interrupt a running pool
+            autorange_min_seconds: Minimum duration of the autorange loop
+            memory_sample_interval: Seconds between RSS samples of the child,
+                                    taken by the parent while it waits
+                                    (None = no memory timeline)
+            journal: Append every result to a JSONL journal in output_dir
+                     as soon as it is produced (compacted by `save()`)
+            resume: Load the existing journal and skip its completed
+                    (algorithm, matrix_type, start_position) jobs;
+                    otherwise an old journal is moved aside to
+                    `rotated_journal` (never deleted)
+            time_budget_seconds: Global wall-clock budget of the whole run,
+                                 counted from construction. A run is only
+                                 started if its full per-run limit fits in
+                                 what is left; otherwise it is recorded as
+                                 skipped (None = no budget)
+            runtime_models_path: JSON file of fitted runtime models
+                                 (see `RuntimeModels`). When the algorithm
+                                 has a model, it replaces the adaptive
+                                 timeout step function, skips runs predicted
+                                 far beyond the per-run cap and gives ETAs;
+                                 every new result refines it
         """
         if algorithm_name not in ALGORITHMS:
             raise ValueError(f"Unknown algorithm: {algorithm_name}. "
                            f"Available: {list(ALGORITHMS.keys())}")
         
+        if (autorange and algorithm_name in PROCESS_POOL_ALGORITHMS
+                and (algorithm_options or {}).get("workers") != 1):
+            raise ValueError(f"{algorithm_name} runs in a process pool, which the autorange "
+                             f"timeout cannot interrupt; run it without autorange "
+                             f"or with workers=1")
+        
         self.algorithm_name = algorithm_name
+        self.algorithm_options = algorithm_options or {}
         self.algorithm = ALGORITHMS[algorithm_name]
+        if self.algorithm_options:
+            self.algorithm = partial(self.algorithm, **self.algorithm_options)
+        self.all_starts_algorithm = ALL_STARTS_ALGORITHMS.get(
+            algorithm_name, partial(solve_each_start, self.algorithm)
+        )
         self.instance_id = instance_id or os.environ.get("EC2_INSTANCE_ID", "local")
         self.output_dir = output_dir
         self.timeout_seconds = timeout_seconds
         self.matrices_dir = matrices_dir
         self.results: List[BenchmarkResult] = []
+        self.warm_workers = warm_workers or (repetition is not None and not autorange)
+        self.separate_memory_run = separate_memory_run
+        self.repetition = repetition
+        self.autorange = autorange
+        self.autorange_min_seconds = autorange_min_seconds
+        self.memory_sample_interval = memory_sample_interval
+        self._worker_pool: Optional[WorkerPool] = None
+        self.time_budget_seconds = time_budget_seconds
+        self._started_at = time.perf_counter()
+        self.runtime_models: Optional[RuntimeModels] = None
+        if runtime_models_path:
+            self.runtime_models = RuntimeModels(runtime_models_path, self.measurement_mode)
+        
+        self._completed: Dict[Tuple, BenchmarkResult] = {}
+        self.journal: Optional[ResultJournal] = None
+        self.rotated_journal: Optional[str] = None
+        if journal:
+            self.journal = ResultJournal(os.path.join(
+                output_dir, f"benchmark_{algorithm_name}.journal.jsonl"
+            ))
+            if resume:
+                for result in self.journal.load():
+                    self.results.append(result)
+                    self._completed[job_key(
+                        result.algorithm, result.matrix_type,
+                        result.start_position, result.all_starts
+                    )] = result
+            else:
+                # A rerun without resume must not destroy a crash journal
+                self.rotated_journal = self.journal.rotate()
+    
+    @property
+    def measurement_mode(self) -> str:
+        """How execution_time_seconds is measured (keys the runtime models)."""
+        if self.autorange:
+            return "autorange"
+        if self.repetition:
+            return "repeated"
+        if self.warm_workers:
+            return "warm_worker"
+        return "new_process"
+    
+    @property
+    def worker_pool(self) -> WorkerPool:
+        """Persistent worker pool, started on first use."""
+        if self._worker_pool is None:
+            self._worker_pool = WorkerPool(size=1)
+        return self._worker_pool
+    
+    def close(self):
+        """Stop the persistent workers, if any."""
+        if self._worker_pool is not None:
+            self._worker_pool.close()
+            self._worker_pool = None
     
     def load_matrix_from_file(self, filepath: str) -> List[List[float]]:
         """Load matrix from JSON file."""
@@ -172,7 +539,8 @@ class BenchmarkRunner:
         matrix_type: str,
         start_position: int,
         timeout: Optional[float] = None,
-        use_adaptive_timeout: bool = True
+        use_adaptive_timeout: bool = True,
+        all_starts: bool = False
     ) -> BenchmarkResult:
         """
         Run a single benchmark with timeout support using multiprocessing.
@@ -183,61 +551,254 @@ class BenchmarkRunner:
             start_position: Starting row position
             timeout: Override default timeout (seconds)
             use_adaptive_timeout: Use adaptive timeout based on matrix size
+            all_starts: Time the all-starts sweep as one job; the result
+                        records the best start row and its path
         
         Returns:
-            BenchmarkResult object
+            BenchmarkResult object (the recorded one if the job is already
+            completed in a resumed journal)
         """
-        if use_adaptive_timeout and timeout is None:
-            matrix_size = max(len(matrix), len(matrix[0]) if matrix else 0)
-            timeout = get_adaptive_timeout(matrix_size)
-        elif timeout is None:
-            timeout = self.timeout_seconds
+        completed = self._completed.get(
+            job_key(self.algorithm_name, matrix_type, start_position, all_starts)
+        )
+        if completed is not None:
+            return completed
         
-        # Use multiprocessing to enable actual timeout
-        result_queue = Queue()
+        if use_adaptive_timeout and timeout is None and self._out_of_reach(matrix, all_starts):
+            return self._skip(matrix, matrix_type, start_position, all_starts, "predicted_timeout")
+        timeout = self._timeout_for(matrix, timeout, use_adaptive_timeout, all_starts)
+        if not self._fits_budget(timeout):
+            return self._skip(matrix, matrix_type, start_position, all_starts, "budget")
         
-        time_start = time.perf_counter()
-        process = Process(target=run_algorithm_in_process, args=(result_queue, self.algorithm, matrix, start_position))
-        process.start()
-        process.join(timeout=timeout)
-        time_end = time.perf_counter()
+        execution_time, timed_out, result_data = self._execute(
+            matrix, start_position, all_starts, timeout
+        )
+        result = self._build_result(
+            matrix, matrix_type, start_position, all_starts, timeout,
+            execution_time, timed_out, result_data
+        )
+        
+        self._record(result)
+        return result
+    
+    def _record(self, result: BenchmarkResult) -> None:
+        """Keep a result and append it to the journal right away."""
+        self.results.append(result)
+        self._completed[job_key(
+            result.algorithm, result.matrix_type, result.start_position, result.all_starts
+        )] = result
+        if self.journal is not None:
+            self.journal.append(result)
+        if self.runtime_models is not None and self.runtime_models.observe(result):
+            self.runtime_models.save()
+    
+    def _skip(
+        self,
+        matrix: List[List[float]],
+        matrix_type: str,
+        start_position: int,
+        all_starts: bool,
+        reason: str
+    ) -> BenchmarkResult:
+        """
+        Record a job that is not run.
+        
+        Skipped results are kept in `results` but not journaled, so a
+        resumed run schedules them again.
+        
+        Args:
+            reason: 'predicted_timeout' (counted as a timeout) or 'budget'
+        """
+        if reason == "predicted_timeout":
+            error_message = "Skipped: predicted timeout"
+        else:
+            error_message = "Skipped: global time budget exhausted"
+        result = BenchmarkResult(
+            algorithm=self.algorithm_name,
+            matrix_type=matrix_type,
+            matrix_rows=len(matrix),
+            matrix_cols=len(matrix[0]) if matrix else 0,
+            start_position=start_position,
+            execution_time_seconds=0.0,
+            path=[],
+            path_cost=0.0,
+            timestamp=datetime.now().isoformat(),
+            instance_id=self.instance_id,
+            timed_out=(reason == "predicted_timeout"),
+            error_message=error_message,
+            all_starts=all_starts,
+            skipped=True,
+            skip_reason=reason
+        )
+        self.results.append(result)
+        return result
+    
+    def remaining_budget(self) -> Optional[float]:
+        """Seconds left of the global time budget (None if there is none)."""
+        if self.time_budget_seconds is None:
+            return None
+        return self.time_budget_seconds - (time.perf_counter() - self._started_at)
+    
+    def _fits_budget(self, timeout: float) -> bool:
+        """Check that a run with this limit cannot overrun the global budget."""
+        remaining = self.remaining_budget()
+        return remaining is None or timeout <= remaining
+    
+    def is_completed(
+        self,
+        matrix_type: str,
+        start_position: int,
+        all_starts: bool = False
+    ) -> bool:
+        """Check whether a job already has a result (e.g. loaded by resume)."""
+        return job_key(self.algorithm_name, matrix_type, start_position, all_starts) in self._completed
+    
+    def _predict(self, matrix: List[List[float]], all_starts: bool) -> Optional[float]:
+        """Runtime predicted by the model (None without one; all-starts jobs are not modelled)."""
+        if self.runtime_models is None or all_starts or not matrix:
+            return None
+        return self.runtime_models.predict(self.algorithm_name, len(matrix), len(matrix[0]))
+    
+    def _out_of_reach(self, matrix: List[List[float]], all_starts: bool) -> bool:
+        """Check whether the model predicts a run far beyond the per-run cap."""
+        if self.runtime_models is None or all_starts or not matrix:
+            return False
+        return self.runtime_models.out_of_reach(self.algorithm_name, len(matrix), len(matrix[0]))
+    
+    def estimate_seconds(self, shapes: List[Tuple[int, int]]) -> Optional[Tuple[float, int]]:
+        """
+        Estimate the wall-clock time of a list of single-start runs.
+        
+        Each run counts its predicted time, capped at its timeout; runs
+        predicted out of reach count nothing since they will be skipped.
         
-        execution_time = time_end - time_start
+        Args:
+            shapes: (rows, cols) of every run
+        
+        Returns:
+            (seconds, runs without a prediction), or None without a
+            runtime model
+        """
+        if self.runtime_models is None:
+            return None
+        seconds = 0.0
+        unknown = 0
+        for rows, cols in shapes:
+            predicted = self.runtime_models.predict(self.algorithm_name, rows, cols)
+            if predicted is None:
+                unknown += 1
+            elif not self.runtime_models.out_of_reach(self.algorithm_name, rows, cols):
+                seconds += min(predicted, self._model_timeout(rows, cols))
+        return seconds, unknown
+    
+    def _model_timeout(self, rows: int, cols: int) -> Optional[float]:
+        """
+        Model-based timeout of one run.
         
-        # Check if timeout occurred
-        timed_out = False
+        Past the largest completed size the model extrapolates, so the
+        limit never drops below the `get_adaptive_timeout` step there.
+        
+        Returns:
+            Seconds, or None if the algorithm has no model yet
+        """
+        timeout = self.runtime_models.timeout_for(self.algorithm_name, rows, cols)
+        if timeout is not None and not self.runtime_models.covers(self.algorithm_name, rows, cols):
+            timeout = max(timeout, get_adaptive_timeout(max(rows, cols)))
+        return timeout
+    
+    def _timeout_for(
+        self,
+        matrix: List[List[float]],
+        timeout: Optional[float],
+        use_adaptive_timeout: bool,
+        all_starts: bool = False
+    ) -> float:
+        """Resolve the timeout of one run (explicit, model-based, adaptive or default)."""
+        if use_adaptive_timeout and timeout is None:
+            if self.runtime_models is not None and not all_starts and matrix:
+                model_timeout = self._model_timeout(len(matrix), len(matrix[0]))
+                if model_timeout is not None:
+                    return model_timeout
+            matrix_size = max(len(matrix), len(matrix[0]) if matrix else 0)
+            return get_adaptive_timeout(matrix_size)
+        if timeout is None:
+            return self.timeout_seconds
+        return timeout
+    
+    def _execute(
+        self,
+        matrix: List[List[float]],
+        start_position: int,
+        all_starts: bool,
+        timeout: float,
+        measure_memory: bool = True
+    ):
+        """
+        Run the algorithm once, in the warm worker pool or a new process.
+        
+        Returns:
+            (execution_time, timed_out, result_data) where result_data is
+            the dict from `execute_algorithm`; on timeout it only holds the
+            'peak_rss_kb' read by the parent, and it is None if the process
+            crashed
+        """
+        algorithm = self.all_starts_algorithm if all_starts else self.algorithm
+        if self.autorange:
+            return self._run_autorange(algorithm, matrix, start_position, all_starts, timeout)
+        args = (algorithm, matrix, start_position, all_starts,
+                self.separate_memory_run, measure_memory)
+        if self.warm_workers:
+            return self._run_in_worker_pool(args, timeout)
+        return self._run_in_new_process(args, timeout)
+    
+    def _build_result(
+        self,
+        matrix: List[List[float]],
+        matrix_type: str,
+        start_position: int,
+        all_starts: bool,
+        timeout: float,
+        execution_time: float,
+        timed_out: bool,
+        result_data: Optional[Dict[str, Any]]
+    ) -> BenchmarkResult:
+        """Turn the outcome of `_execute` into a BenchmarkResult."""
         error_message = None
         path = []
+        path_cost = 0.0
         peak_memory_kb = None
+        algorithm_stats = None
+        algorithm_wall_seconds = None
+        algorithm_cpu_seconds = None
+        orchestration_overhead_seconds = None
+        autorange_loops = None
+        usage = {}
         
-        if process.is_alive():
-            # Process timed out
-            process.terminate()
-            process.join(timeout=5)  # Wait up to 5s for graceful termination
-            if process.is_alive():
-                process.kill()  # Force kill if still alive
-            timed_out = True
+        if timed_out:
             error_message = f"Timeout after {timeout}s"
-            path = []
-            path_cost = 0.0
+            usage = result_data or {}
+        elif result_data is not None:
+            path = result_data["path"] if result_data["path"] else []
+            error_message = result_data["error"]
+            path_cost = calculate_path_cost(matrix, path) if path else 0.0
+            peak_memory_kb = result_data.get("peak_memory_kb")
+            if result_data.get("start_position") is not None:
+                start_position = result_data["start_position"]
+            algorithm_stats = result_data.get("algorithm_stats")
+            algorithm_wall_seconds = result_data.get("algorithm_wall_seconds")
+            algorithm_cpu_seconds = result_data.get("algorithm_cpu_seconds")
+            autorange_loops = result_data.get("autorange_loops")
+            usage = result_data
+            if result_data.get("child_seconds") is not None:
+                orchestration_overhead_seconds = execution_time - result_data["child_seconds"]
+            # Round to 2 decimal places if we have memory data
+            if peak_memory_kb is not None:
+                peak_memory_kb = round(peak_memory_kb, 2)
         else:
-            # Process completed
-            if not result_queue.empty():
-                result_data = result_queue.get()
-                path = result_data["path"] if result_data["path"] else []
-                error_message = result_data["error"]
-                path_cost = calculate_path_cost(matrix, path) if path else 0.0
-                peak_memory_kb = result_data.get("peak_memory_kb")
-                # Round to 2 decimal places if we have memory data
-                if peak_memory_kb is not None:
-                    peak_memory_kb = round(peak_memory_kb, 2)
-            else:
-                # Process exited without putting result (crashed)
-                path = []
-                path_cost = 0.0
-                error_message = "Process crashed without returning result"
+            # Process exited without putting result (crashed)
+            error_message = "Process crashed without returning result"
         
-        result = BenchmarkResult(
+        return BenchmarkResult(
             algorithm=self.algorithm_name,
             matrix_type=matrix_type,
             matrix_rows=len(matrix),
@@ -250,17 +811,272 @@ class BenchmarkRunner:
             instance_id=self.instance_id,
             timed_out=timed_out,
             error_message=error_message,
-            peak_memory_kb=peak_memory_kb
+            peak_memory_kb=peak_memory_kb,
+            all_starts=all_starts,
+            algorithm_stats=algorithm_stats,
+            algorithm_wall_seconds=algorithm_wall_seconds,
+            algorithm_cpu_seconds=algorithm_cpu_seconds,
+            orchestration_overhead_seconds=orchestration_overhead_seconds,
+            autorange_loops=autorange_loops,
+            peak_rss_kb=usage.get("peak_rss_kb"),
+            children_peak_rss_kb=usage.get("children_peak_rss_kb"),
+            user_cpu_seconds=usage.get("user_cpu_seconds"),
+            system_cpu_seconds=usage.get("system_cpu_seconds"),
+            voluntary_ctx_switches=usage.get("voluntary_ctx_switches"),
+            involuntary_ctx_switches=usage.get("involuntary_ctx_switches"),
+            memory_timeline=usage.get("memory_timeline"),
+            predicted_seconds=self._predict(matrix, all_starts),
+            timeout_seconds=timeout
         )
+    
+    def _run_in_new_process(self, args: Tuple, timeout: float):
+        """
+        Run one job in a freshly spawned process.
         
-        self.results.append(result)
-        return result
+        Args:
+            args: Arguments of `execute_algorithm`
+            timeout: Seconds before the process is terminated
+        
+        Returns:
+            Same tuple as `_execute`
+        """
+        # Use multiprocessing to enable actual timeout
+        result_queue = Queue()
+        
+        time_start = time.perf_counter()
+        process = Process(
+            target=run_algorithm_in_process,
+            args=(result_queue,) + args
+        )
+        process.start()
+        received = []
+        
+        def wait(seconds):
+            # Drain the queue while waiting: a result larger than the pipe
+            # buffer keeps the child from exiting until it is read
+            try:
+                received.append(result_queue.get(timeout=seconds))
+                return True
+            except Empty:
+                return not process.is_alive()
+        
+        timeline = None
+        try:
+            if self.memory_sample_interval is not None:
+                timeline = []
+                wait_sampling_rss(wait, process.pid, timeout, self.memory_sample_interval, timeline)
+            else:
+                deadline = time_start + timeout
+                # Short slices so a crashed child is noticed before the timeout
+                while not wait(min(_RESULT_POLL_SECONDS, max(0.0, deadline - time.perf_counter()))):
+                    if time.perf_counter() >= deadline:
+                        break
+        except BaseException:
+            # The child's own group does not get the terminal's Ctrl+C
+            kill_process_group(process)
+            raise
+        time_end = time.perf_counter()
+        
+        if not received and process.is_alive():
+            # Process timed out: keep its peak RSS so far, then kill it
+            # together with any pool workers it started
+            partial_usage = {"peak_rss_kb": peak_rss_kb(process.pid), "memory_timeline": timeline}
+            kill_process_group(process)
+            return time_end - time_start, True, partial_usage
+        
+        process.join()
+        if not received and not result_queue.empty():
+            received.append(result_queue.get())  # Put just before exiting
+        result_data = received[0] if received else None
+        if result_data is not None:
+            result_data["memory_timeline"] = timeline
+        return time_end - time_start, False, result_data
+    
+    def _run_in_worker_pool(self, args: Tuple, timeout: float):
+        """
+        Run one job in the persistent worker pool (no process startup).
+        
+        A stuck worker is killed and respawned by the pool.
+        
+        Args:
+            args: Arguments of `execute_algorithm`
+            timeout: Seconds before the worker is replaced
+        
+        Returns:
+            Same tuple as `_execute`
+        """
+        timeline = [] if self.memory_sample_interval is not None else None
+        time_start = time.perf_counter()
+        try:
+            result_data = self.worker_pool.run(
+                execute_algorithm, args, timeout,
+                sample_interval=self.memory_sample_interval,
+                timeline=timeline
+            )
+        except WorkerTimeout as timeout_error:
+            partial_usage = {"peak_rss_kb": timeout_error.peak_rss_kb, "memory_timeline": timeline}
+            return time.perf_counter() - time_start, True, partial_usage
+        except WorkerCrashed:
+            return time.perf_counter() - time_start, False, None
+        time_end = time.perf_counter()
+        result_data["memory_timeline"] = timeline
+        return time_end - time_start, False, result_data
+    
+    def _run_autorange(
+        self,
+        algorithm: Callable,
+        matrix: List[List[float]],
+        start_position: int,
+        all_starts: bool,
+        timeout: float
+    ):
+        """
+        Run one job in-process with `autorange_algorithm`.
+        
+        Returns:
+            Same tuple as `_execute`; the execution time is the per-call
+            time of the autorange loop
+        """
+        time_start = time.perf_counter()
+        try:
+            result_data = autorange_algorithm(
+                algorithm, matrix, start_position, all_starts,
+                self.autorange_min_seconds, timeout
+            )
+        except AutorangeTimeout:
+            return time.perf_counter() - time_start, True, None
+        if result_data["error"]:
+            return time.perf_counter() - time_start, False, result_data
+        return result_data["algorithm_wall_seconds"], False, result_data
+    
+    def run_repeated(
+        self,
+        jobs: List[Tuple[List[List[float]], str, int]],
+        all_starts: bool = False
+    ) -> List[BenchmarkResult]:
+        """
+        Time every job repeatedly, interleaving jobs to spread out drift.
+        
+        Each job first runs `warmup` times (the first warm-up run records
+        the path, memory and algorithm stats). Then one sample per active
+        job is taken per round, round-robin, until the job's median
+        confidence interval is tight enough, it reaches `max_samples`, or
+        its time budget runs out. Samples are the child-side
+        `algorithm_wall_seconds` of untraced runs. A timeout or error
+        ends the job with that outcome. Each job is journaled as soon as
+        it finishes; jobs already completed (resume) are not run again.
+        No run is started once the global time budget cannot cover it.
+        
+        Args:
+            jobs: (matrix, matrix_type, start_position) tuples
+            all_starts: Time the all-starts sweep (see `run_single`)
+        
+        Returns:
+            One BenchmarkResult per job, with execution_time_seconds set
+            to the median sample and the raw samples attached
+        """
+        settings = self.repetition or RepetitionSettings()
+        states = []
+        for matrix, matrix_type, start_position in jobs:
+            key = job_key(self.algorithm_name, matrix_type, start_position, all_starts)
+            states.append({
+                "matrix": matrix,
+                "matrix_type": matrix_type,
+                "start_position": start_position,
+                "timeout": self._timeout_for(matrix, None, True, all_starts),
+                "result": self._completed.get(key),
+                "samples": [],
+                "spent": 0.0,
+                "done": key in self._completed,
+            })
+            if not states[-1]["done"] and self._out_of_reach(matrix, all_starts):
+                states[-1]["done"] = True
+                states[-1]["result"] = self._skip(
+                    matrix, matrix_type, start_position, all_starts, "predicted_timeout"
+                )
+        
+        def finish(state):
+            # Summarize and journal the job as soon as it is done
+            state["done"] = True
+            result = state["result"]
+            if state["samples"] and not result.timed_out and not result.error_message:
+                summary = summarize_samples(state["samples"])
+                result.samples = state["samples"]
+                result.median_seconds = summary["median_seconds"]
+                result.iqr_seconds = summary["iqr_seconds"]
+                result.min_seconds = summary["min_seconds"]
+                result.sample_count = summary["sample_count"]
+                result.execution_time_seconds = summary["median_seconds"]
+            self._record(result)
+        
+        def run_once(state, measure_memory):
+            if not self._fits_budget(state["timeout"]):
+                # Out of budget: keep the samples taken so far, if any
+                if state["result"] is None:
+                    state["done"] = True
+                    state["result"] = self._skip(
+                        state["matrix"], state["matrix_type"], state["start_position"],
+                        all_starts, "budget"
+                    )
+                else:
+                    finish(state)
+                return None
+            outcome = self._execute(
+                state["matrix"], state["start_position"], all_starts,
+                state["timeout"], measure_memory
+            )
+            state["spent"] += outcome[0]
+            execution_time, timed_out, result_data = outcome
+            if timed_out or result_data is None or result_data["error"]:
+                state["result"] = self._build_result(
+                    state["matrix"], state["matrix_type"], state["start_position"],
+                    all_starts, state["timeout"], *outcome
+                )
+                finish(state)
+            return outcome
+        
+        # Warm-up, job by job
+        for state in states:
+            if state["done"]:
+                continue
+            for i in range(settings.warmup):
+                outcome = run_once(state, measure_memory=(i == 0))
+                if state["done"]:
+                    break
+                if i == 0:
+                    state["result"] = self._build_result(
+                        state["matrix"], state["matrix_type"], state["start_position"],
+                        all_starts, state["timeout"], *outcome
+                    )
+        
+        # Interleaved sampling rounds
+        active = [state for state in states if not state["done"]]
+        while active:
+            for state in active:
+                outcome = run_once(state, measure_memory=False)
+                if state["done"]:
+                    continue
+                if state["result"] is None:
+                    state["result"] = self._build_result(
+                        state["matrix"], state["matrix_type"], state["start_position"],
+                        all_starts, state["timeout"], *outcome
+                    )
+                samples = state["samples"]
+                samples.append(outcome[2]["algorithm_wall_seconds"])
+                if (has_converged(samples, settings)
+                        or len(samples) >= settings.max_samples
+                        or state["spent"] >= settings.job_budget_seconds):
+                    finish(state)
+            active = [state for state in active if not state["done"]]
+        
+        return [state["result"] for state in states]
     
     def run_preset_benchmarks(
         self,
         preset_names: Optional[List[str]] = None,
         seeds: List[int] = None,
-        start_positions: Optional[List[int]] = None
+        start_positions: Optional[List[int]] = None,
+        all_starts: bool = False
     ) -> List[BenchmarkResult]:
         """
         Run benchmarks on preset matrix configurations.
@@ -270,6 +1086,8 @@ class BenchmarkRunner:
             preset_names: List of preset names to test (None = all)
             seeds: Random seeds for reproducibility (None = [42,123,456])
             start_positions: Starting positions to test (None = [0] only)
+            all_starts: Solve every start row as a single job per matrix
+                        (start_positions is ignored)
         
         Returns:
             List of BenchmarkResult objects
@@ -285,6 +1103,7 @@ class BenchmarkRunner:
                 # Use only presets that have available files
                 preset_names = [p for p in preset_names if p in available_files]
         
+        jobs = []  # Collected in repetition mode, then run interleaved
         for preset_name in preset_names:
             # Get available seeds for this preset
             if self.matrices_dir and available_files:
@@ -316,28 +1135,64 @@ class BenchmarkRunner:
                 else:
                     matrix = get_matrix_by_preset(preset_name, seed=seed)
                 
-                if start_positions is None:
+                if all_starts:
+                    positions = [0]  # Single job covering every start row
+                elif start_positions is None:
                     positions = [0]  # Only test from top row
                 else:
                     positions = start_positions
                 
                 for start_pos in positions:
-                    print(f"  {preset_name} (semilla={seed}, inicio={start_pos}): ", end="", flush=True)
+                    if self.repetition:
+                        jobs.append((matrix, f"{preset_name}_seed{seed}", start_pos))
+                        continue
+                    start_label = "todas" if all_starts else start_pos
+                    print(f"  {preset_name} (semilla={seed}, inicio={start_label}): ", end="", flush=True)
+                    if self.is_completed(f"{preset_name}_seed{seed}", start_pos, all_starts):
+                        print("ya completado (reanudado)")
+                        continue
                     result = self.run_single(
                         matrix=matrix,
                         matrix_type=f"{preset_name}_seed{seed}",
                         start_position=start_pos,
-                        use_adaptive_timeout=True
+                        use_adaptive_timeout=True,
+                        all_starts=all_starts
                     )
-                    if result.timed_out:
+                    if result.skipped:
+                        print(f"OMITIDO ({_SKIP_MESSAGES[result.skip_reason]})")
+                    elif result.timed_out:
                         print(f"TIMEOUT ({result.execution_time_seconds:.1f}s)")
                     elif result.error_message:
                         print(f"ERROR: {result.error_message}")
                     else:
-                        print(f"{result.execution_time_seconds:.4f}s")
+                        print(f"{result.execution_time_seconds:.{7 if self.autorange else 4}f}s")
+        
+        if jobs:
+            self._run_repeated_jobs(jobs, all_starts)
         
         return self.results
     
+    def _run_repeated_jobs(
+        self,
+        jobs: List[Tuple[List[List[float]], str, int]],
+        all_starts: bool = False
+    ) -> List[BenchmarkResult]:
+        """Run collected jobs with `run_repeated` and print one line per job."""
+        print(f"  Repitiendo {len(jobs)} trabajos intercalados...", flush=True)
+        results = self.run_repeated(jobs, all_starts=all_starts)
+        for result in results:
+            print(f"  {result.matrix_type} (inicio={result.start_position}): ", end="")
+            if result.skipped:
+                print(f"OMITIDO ({_SKIP_MESSAGES[result.skip_reason]})")
+            elif result.timed_out:
+                print("TIMEOUT")
+            elif result.error_message:
+                print(f"ERROR: {result.error_message}")
+            else:
+                print(f"mediana {result.median_seconds:.6f}s, "
+                      f"IQR {result.iqr_seconds:.6f}s, n={result.sample_count}")
+        return results
+    
     def run_complexity_analysis(
         self,
         sizes: Optional[List[int]] = None,
@@ -347,6 +1202,12 @@ class BenchmarkRunner:
         Run complexity analysis with increasing matrix sizes.
         Uses pre-generated matrices if matrices_dir is set.
         
+        Sizes run in increasing order. Once a run of some size times out
+        with a limit no shorter than its `get_adaptive_timeout` step,
+        every larger size is recorded as a predicted timeout
+        (skipped=True) instead of being run. With a global time budget,
+        runs whose adaptive timeout no longer fits are skipped too.
+        
         Args:
             sizes: List of matrix sizes to test (None = [5,7,9,10,11,12,15,18,20,30,50,75,100])
             seeds: Random seeds for reproducibility (None = [42,123,456,789,1011])
@@ -365,6 +1226,7 @@ class BenchmarkRunner:
                 # Use only sizes that have available files
                 sizes = [s for s in sizes if s in available_files]
         
+        seeds_by_size = {}
         for size in sizes:
             # Get available seeds for this size
             if self.matrices_dir and available_files:
@@ -385,31 +1247,74 @@ class BenchmarkRunner:
             else:
                 # Fallback to hardcoded seeds if not using pre-generated matrices
                 current_seeds = seeds if seeds is not None else [42, 123, 456, 789, 1011]
+            seeds_by_size[size] = current_seeds
         
-        for size in sizes:
-            for seed in current_seeds:
+        estimate = self.estimate_seconds(
+            [(size, size) for size, size_seeds in seeds_by_size.items() for _ in size_seeds]
+        )
+        if estimate is not None:
+            print(f"  Tiempo estimado: {estimate[0]:.1f}s "
+                  f"({estimate[1]} trabajos sin predicción)", flush=True)
+        
+        cutoff_size = None  # Smallest size that timed out
+        for size in sorted(seeds_by_size):
+            jobs = []  # Collected in repetition mode, then run interleaved
+            size_results = []
+            for seed in seeds_by_size[size]:
+                matrix_type = f"square_{size}x{size}_seed{seed}"
                 # Load or generate square matrix (n×n)
                 if self.matrices_dir and available_files:
                     # Use the actual filename from available files
-                    filename = f"square_{size}x{size}_seed{seed}.json"
+                    filename = f"{matrix_type}.json"
                     filepath = os.path.join(self.matrices_dir, "complexity", filename)
                     matrix = self.load_matrix_from_file(filepath)
                 else:
                     matrix = matrix_random(size, size, -10, 10, integers=False, seed=seed)
                 
+                if cutoff_size is not None:
+                    print(f"  {size}×{size} (semilla={seed}): OMITIDO "
+                          f"(timeout previsto, {cutoff_size}×{cutoff_size} ya superó el límite)")
+                    self._skip(matrix, matrix_type, 0, False, "predicted_timeout")
+                    continue
+                
+                if self.repetition:
+                    jobs.append((matrix, matrix_type, 0))
+                    continue
+                
                 print(f"  {size}×{size} (semilla={seed}): ", end="", flush=True)
+                if self.is_completed(matrix_type, 0):
+                    print("ya completado (reanudado)")
+                    size_results.append(self._completed[job_key(self.algorithm_name, matrix_type, 0, False)])
+                    continue
                 result = self.run_single(
                     matrix=matrix,
-                    matrix_type=f"square_{size}x{size}_seed{seed}",
+                    matrix_type=matrix_type,
                     start_position=0,
                     use_adaptive_timeout=True
                 )
-                if result.timed_out:
+                size_results.append(result)
+                if result.skipped:
+                    print(f"OMITIDO ({_SKIP_MESSAGES[result.skip_reason]})")
+                elif result.timed_out:
                     print(f"TIMEOUT ({result.execution_time_seconds:.1f}s)")
                 elif result.error_message:
                     print(f"ERROR")
                 else:
-                    print(f"{result.execution_time_seconds:.4f}s")
+                    print(f"{result.execution_time_seconds:.{7 if self.autorange else 4}f}s")
+            
+            if jobs:
+                size_results.extend(self._run_repeated_jobs(jobs))
+            
+            # Running time grows with size: larger sizes would time out too.
+            # Only a limit at least as long as the adaptive step counts; a
+            # shorter model-based limit may just be an underprediction
+            adaptive_limit = get_adaptive_timeout(size)
+            if cutoff_size is None and any(
+                r.timed_out and not r.skipped
+                and (r.timeout_seconds is None or r.timeout_seconds >= adaptive_limit)
+                for r in size_results
+            ):
+                cutoff_size = size
         
         return self.results
     
@@ -420,16 +1325,22 @@ class BenchmarkRunner:
         Args:
             format: Output format ('json' or 'csv')
         
+        The journal is compacted into this file and then removed.
+        
         Returns:
             Path to saved file
         """
-        return save_results(
+        filepath = save_results(
             results=self.results,
             output_dir=self.output_dir,
             format=format,
             filename_prefix=f"benchmark_{self.algorithm_name}"
         )
+        if self.journal is not None:
+            self.journal.clear()
+        return filepath
     
     def clear_results(self):
         """Clear stored results."""
         self.results = []
+        self._completed = {}
@@ -0,0 +1,200 @@
+"""Persistent pre-started worker processes for benchmark jobs."""
+
+import atexit
+import os
+import signal
+import threading
+from multiprocessing import Pipe, Process
+from typing import Any, Callable, List, Optional, Tuple
+
+from .resources import peak_rss_kb, wait_sampling_rss
+
+
+class WorkerTimeout(Exception):
+    """The job did not finish in time; its worker was killed and replaced."""
+
+    def __init__(self, message: str, peak_rss_kb: Optional[float] = None):
+        super().__init__(message)
+        self.peak_rss_kb = peak_rss_kb  # Worker's peak RSS read before the kill
+
+
+class WorkerCrashed(Exception):
+    """The worker died without returning a result; it was replaced."""
+
+
+def start_process_group() -> None:
+    """
+    Make the calling process the leader of a new process group (POSIX).
+
+    Processes it starts later (e.g. a ProcessPoolExecutor inside an
+    algorithm) join the group, so `kill_process_group` reaches them.
+    """
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+
+
+def kill_process_group(process: Process) -> None:
+    """
+    Kill a process and everything in its process group, then reap it.
+
+    Without this, pool workers of a killed job keep running as orphans
+    and skew every later measurement. Falls back to killing the process
+    alone if it is not (yet) a group leader.
+    """
+    if hasattr(os, "killpg") and process.pid is not None:
+        try:
+            if os.getpgid(process.pid) == process.pid:
+                os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    if process.is_alive():
+        process.kill()
+    process.join()
+
+
+def _worker_main(conn) -> None:
+    """Run (function, args) jobs received over the pipe until told to stop."""
+    start_process_group()
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        function, args = job
+        try:
+            conn.send((True, function(*args)))
+        except Exception as e:
+            conn.send((False, str(e)))
+
+
+class _Worker:
+    """One worker process and the parent end of its pipe."""
+
+    def __init__(self):
+        self.conn, child_conn = Pipe()
+        # Not a daemon: jobs may start their own process pools
+        self.process = Process(target=_worker_main, args=(child_conn,))
+        self.process.start()
+        child_conn.close()
+
+    def stop(self, kill: bool = False) -> None:
+        """Ask the worker to exit (or kill it) and reap the process."""
+        if not kill:
+            try:
+                self.conn.send(None)
+                self.process.join(timeout=5)
+            except (BrokenPipeError, OSError):
+                pass
+        if kill or self.process.is_alive():
+            kill_process_group(self.process)
+        self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """
+    Pool of pre-started worker processes that receive jobs over a pipe.
+
+    Workers are started once and reused, so a job pays for pickling its
+    arguments but not for process startup and module imports. A job that
+    exceeds its timeout (or crashes its worker) only costs that worker,
+    which is killed and replaced by a fresh one.
+    """
+
+    def __init__(self, size: int = 1):
+        """
+        Args:
+            size: Number of workers started up front
+        """
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = [_Worker() for _ in range(size)]
+        self._busy: List[_Worker] = []
+        self.respawns = 0
+        atexit.register(self.close)
+
+    def run(
+        self,
+        function: Callable,
+        args: Tuple,
+        timeout: float,
+        sample_interval: Optional[float] = None,
+        timeline: Optional[List[List[float]]] = None
+    ) -> Any:
+        """
+        Run function(*args) in an idle worker.
+
+        Args:
+            function: Picklable callable executed in the worker
+            args: Picklable positional arguments
+            timeout: Seconds to wait for the result
+            sample_interval: If set, sample the worker's RSS at this
+                             interval while waiting
+            timeline: Receives the [elapsed_seconds, rss_kb] samples
+
+        Returns:
+            The value returned by the function
+
+        Raises:
+            WorkerTimeout: No result within `timeout`
+            WorkerCrashed: The worker died while running the job
+            RuntimeError: The function raised; carries its message
+        """
+        with self._lock:
+            worker = self._idle.pop() if self._idle else _Worker()
+            self._busy.append(worker)
+
+        try:
+            worker.conn.send((function, args))
+            if sample_interval is not None:
+                finished = wait_sampling_rss(
+                    worker.conn.poll, worker.process.pid, timeout,
+                    sample_interval, timeline if timeline is not None else []
+                )
+            else:
+                finished = worker.conn.poll(timeout)
+            if not finished:
+                stuck_peak_rss_kb = peak_rss_kb(worker.process.pid)
+                worker = self._replace(worker)
+                raise WorkerTimeout(f"Timeout after {timeout}s", stuck_peak_rss_kb)
+            try:
+                ok, value = worker.conn.recv()
+            except (EOFError, OSError):
+                worker = self._replace(worker)
+                raise WorkerCrashed("Process crashed without returning result")
+        except (BrokenPipeError, OSError):
+            worker = self._replace(worker)
+            raise WorkerCrashed("Process crashed without returning result")
+        finally:
+            with self._lock:
+                self._busy.remove(worker)
+                self._idle.append(worker)
+
+        if not ok:
+            raise RuntimeError(value)
+        return value
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        """Kill a stuck or dead worker and start a fresh one in its place."""
+        worker.stop(kill=True)
+        fresh = _Worker()
+        with self._lock:
+            self._busy[self._busy.index(worker)] = fresh
+            self.respawns += 1
+        return fresh
+
+    def close(self) -> None:
+        """Stop every worker (idempotent)."""
+        with self._lock:
+            workers = self._idle + self._busy
+            self._idle, self._busy = [], []
+        for worker in workers:
+            worker.stop()
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -353,6 +353,10 @@ def main():
     # Convert to DataFrame
     df = pd.DataFrame(all_results)
     
+    # Jobs skipped for lack of time budget were never measured
+    if 'skip_reason' in df.columns:
+        df = df[df['skip_reason'] != 'budget'].copy()
+    
     # Filter successful results
     df_success = df[df['timed_out'] == False].copy()
     print(f"[OK] {len(df_success)} resultados exitosos (sin timeouts)")
@@ -395,6 +399,7 @@ def main():
         generate_individual_boxplots(df_success, algorithm_labels)
         generate_speedup_analysis(df_success, algorithm_labels)
         generate_detailed_statistics(df_success, algorithm_labels)
+        generate_memory_timeline(df_success, algorithm_labels)
         
         print("\n" + "="*60)
         print("[OK] ¡Todas las visualizaciones se generaron exitosamente!")
@@ -409,6 +414,43 @@ def main():
         return 1
 
 
+def generate_memory_timeline(df_success, algorithm_labels):
+    """Plot RSS over time for the largest sampled job of each algorithm"""
+    print("  [+] Memoria en el tiempo (memory_timeline)...")
+    
+    if 'memory_timeline' not in df_success.columns:
+        print("  [SKIP] No hay series de memoria (usar --memory-sample-interval)")
+        return
+    
+    df_timeline = df_success[df_success['memory_timeline'].map(
+        lambda t: isinstance(t, list) and len(t) > 1
+    )].copy()
+    if len(df_timeline) == 0:
+        print("  [SKIP] No hay series de memoria válidas")
+        return
+    
+    df_timeline['cells'] = df_timeline['matrix_rows'] * df_timeline['matrix_cols']
+    largest = df_timeline.loc[df_timeline.groupby('algorithm')['cells'].idxmax()]
+    
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for _, row in largest.iterrows():
+        timeline = np.array(row['memory_timeline'], dtype=float)
+        label = f"{algorithm_labels.get(row['algorithm'], row['algorithm'].title())} ({row['matrix_type']})"
+        ax.plot(timeline[:, 0], timeline[:, 1] / 1024, label=label, linewidth=1.5)
+    
+    ax.set_xlabel('Tiempo (s)', fontsize=12)
+    ax.set_ylabel('RSS (MB)', fontsize=12)
+    ax.set_title('Memoria del Proceso en el Tiempo', fontsize=14, fontweight='bold')
+    ax.legend(fontsize=9)
+    ax.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig('visualizations/memory_timeline.png', dpi=150, bbox_inches='tight')
+    plt.close()
+    
+    print("  [OK] Gráfica de memoria en el tiempo guardada")
+
+
 def generate_enhanced_boxplots(df_success, algorithm_labels):
     """Generate enhanced boxplots with better visibility and statistics"""
     print("  [5/8] Boxplots mejorados con estadísticas...")
@@ -12,10 +12,32 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.algorithms import (
     brute_force,
+    brute_force_iterative,
     backtracking,
+    backtracking_bounded,
+    backtracking_iterative,
     divide_and_conquer,
+    parallel_brute_force,
+    parallel_divide_and_conquer,
+    parallel_backtracking,
+    parallel_blocks,
+    threaded,
     memoization,
+    memoization_stack,
     tabulation,
+    vectorized,
+    vectorized_packed,
+    vectorized_checkpoint,
+    streaming,
+    streaming_columns,
+    tabulation_all_starts,
+    vectorized_all_starts,
+    solve_each_start,
+    batch_vectorized,
+    dijkstra,
+    astar,
+    IncrementalSolver,
+    TropicalSegmentTree,
 )
 
 # =============================================================================
@@ -405,9 +427,24 @@ def validate_path(matrix, path, start_row=0):
 ALGORITHMS = [
     ("brute_force", lambda M, y: brute_force(M, y)),
     ("backtracking", lambda M, y: backtracking(M, y)),
+    ("backtracking_bounded", lambda M, y: backtracking_bounded(M, y)),
+    ("brute_force_iterative", lambda M, y: brute_force_iterative(M, y)),
+    ("backtracking_iterative", lambda M, y: backtracking_iterative(M, y)),
     ("divide_and_conquer", lambda M, y: divide_and_conquer(M, y)),
+    ("parallel_brute_force", lambda M, y: parallel_brute_force(M, y)),
+    ("parallel_divide_and_conquer", lambda M, y: parallel_divide_and_conquer(M, y)),
+    ("parallel_backtracking", lambda M, y: parallel_backtracking(M, y)),
     ("memoization", lambda M, y: memoization(M, y)),
+    ("memoization_stack", lambda M, y: memoization_stack(M, y)),
     ("tabulation", lambda M, y: tabulation(M, y)),
+    ("vectorized", lambda M, y: vectorized(M, y)),
+    ("vectorized_packed", lambda M, y: vectorized_packed(M, y)),
+    ("vectorized_checkpoint", lambda M, y: vectorized_checkpoint(M, y)),
+    ("streaming", lambda M, y: streaming(M, y)),
+    ("parallel_blocks", lambda M, y: parallel_blocks(M, y, blocks=3, workers=1)),
+    ("threaded", lambda M, y: threaded(M, y, threads=2)),
+    ("dijkstra", lambda M, y: dijkstra(M, y)),
+    ("astar", lambda M, y: astar(M, y)),
 ]
 
 MATRICES = [
@@ -499,7 +536,9 @@ def test_algorithm_consistency():
             ("backtracking", backtracking),
             ("divide_and_conquer", divide_and_conquer),
             ("memoization", memoization),
+            ("memoization_stack", memoization_stack),
             ("tabulation", tabulation),
+            ("vectorized", vectorized),
         ]
 
         for algo_name, algorithm in algorithms_to_test:
@@ -547,7 +586,9 @@ def test_dp_optimality():
         # Algoritmos óptimos (deberían dar el mejor resultado posible)
         optimal_algorithms = [
             ("memoization", memoization),
+            ("memoization_stack", memoization_stack),
             ("tabulation", tabulation),
+            ("vectorized", vectorized),
         ]
 
         # Algoritmos que pueden ser subóptimos o no terminar
@@ -687,5 +728,304 @@ def test_path_uniqueness():
             continue
 
 
+@pytest.mark.parametrize("engine", [
+    vectorized,
+    vectorized_packed,
+    vectorized_checkpoint,
+    lambda M, y: vectorized_checkpoint(M, y, interval=1),
+    lambda M, y: vectorized_checkpoint(M, y, interval=3),
+])
+def test_vectorized_matches_tabulation(engine):
+    """Verifica que los motores vectorizados reproduzcan exactamente el camino de tabulation (mismo desempate)."""
+    import random
+    import numpy as np
+
+    rng = random.Random(7)
+    for _ in range(200):
+        rows, cols = rng.randint(1, 9), rng.randint(1, 8)
+        matrix = [[rng.randint(-3, 3) for _ in range(cols)] for _ in range(rows)]
+        for start in range(rows):
+            assert engine(matrix, start) == tabulation(matrix, start)
+
+    # Matriz más ancha que un bloque de columnas, como lista y como ndarray
+    wide = np.random.default_rng(7).uniform(-10, 10, (13, 2500))
+    assert engine(wide, 3) == tabulation(wide.tolist(), 3)
+    assert engine(wide.tolist(), 3) == engine(wide, 3)
+
+
+def test_all_starts():
+    """Verifica que el modo de todas las filas de inicio coincida con resolver cada fila por separado."""
+    for matrix in [M1, M2, M5, M11, M12, M16, M18, M26]:
+        expected = solve_each_start(tabulation, matrix)
+
+        for solver in (tabulation_all_starts, vectorized_all_starts):
+            result = solver(matrix)
+            assert result["paths"] == expected["paths"]
+            assert result["costs"] == pytest.approx(expected["costs"], rel=1e-9)
+            assert result["best_start"] == expected["best_start"]
+            assert result["best_cost"] == pytest.approx(min(expected["costs"]), rel=1e-9)
+            assert result["best_path"] == result["paths"][result["best_start"]]
+
+    assert tabulation_all_starts(M8)["best_path"] == []
+    assert vectorized_all_starts(M8)["best_path"] == []
+
+
+def test_batch_vectorized():
+    """Verifica que el solver por lotes coincida con tabulation matriz por matriz."""
+    import numpy as np
+
+    # Lista con formas mezcladas (se agrupan por forma) y matriz vacía
+    matrices = [M1, M2, M3, M4, M8, M15, M18, M26, M1]
+    starts = [0, 1, 1, 0, 0, 2, 1, 2, 4]
+    paths, costs = batch_vectorized(matrices, starts)
+
+    for matrix, start, path, cost in zip(matrices, starts, paths, costs):
+        assert path == tabulation(matrix, start)
+        assert cost == pytest.approx(calculate_path_cost(matrix, path), rel=1e-9)
+
+    # Arreglo (batch, filas, columnas)
+    stack = np.random.default_rng(3).uniform(-10, 10, (50, 6, 9))
+    paths, costs = batch_vectorized(stack)
+    assert paths == [tabulation(m.tolist(), 0) for m in stack]
+    starts = np.arange(50) % 6
+    paths, _ = batch_vectorized(stack, starts)
+    assert paths == [tabulation(m.tolist(), int(s)) for m, s in zip(stack, starts)]
+    assert batch_vectorized(np.empty((3, 0, 4))) == ([[], [], []], [0.0] * 3)
+
+    # El arreglo 3-D se barre sin copiarlo (la copia duplicaría la memoria pico)
+    import tracemalloc
+    big = np.random.default_rng(4).uniform(-10, 10, (100, 20, 2000))
+    tracemalloc.start()
+    batch_vectorized(big)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < big.nbytes
+
+
+def test_streaming_sources(tmp_path):
+    """Verifica el solver streaming desde un iterador de columnas y desde un .npy mapeado en memoria."""
+    import numpy as np
+
+    for matrix in [M1, M2, M16, M18, M22, M26]:
+        columns = (list(col) for col in zip(*matrix))
+        path = streaming_columns(columns, 1)
+        assert validate_path(matrix, path) and path[0] == [0, 1]
+        assert calculate_path_cost(matrix, path) == pytest.approx(
+            calculate_path_cost(matrix, tabulation(matrix, 1)), rel=1e-9)
+
+    wide = np.random.default_rng(11).uniform(-10, 10, (9, 3000))
+    filepath = tmp_path / "wide.npy"
+    np.save(filepath, np.asfortranarray(wide))
+    path = streaming(str(filepath), 4, spill_dir=str(tmp_path))
+    expected = vectorized(wide, 4)
+    assert path[0] == [0, 4]
+    assert sum(wide[r, c] for c, r in path) == pytest.approx(sum(wide[r, c] for c, r in expected))
+
+
+def test_memoization_stack_wide_matrix():
+    """Verifica que memoization_stack resuelva matrices más anchas que el límite de recursión."""
+    import random
+
+    rng = random.Random(5)
+    cols = sys.getrecursionlimit() * 2
+    matrix = [[rng.uniform(-10, 10) for _ in range(cols)] for _ in range(4)]
+
+    path = memoization_stack(matrix, 2)
+    assert validate_path(matrix, path)
+    assert path == tabulation(matrix, 2)
+
+
+def test_parallel_exhaustive_pool():
+    """Verifica que la búsqueda paralela por prefijos (pool de 2 procesos) coincida con la serial."""
+    for matrix in [M1, M2, M15, M18, M22]:
+        assert parallel_brute_force(matrix, 0, depth=2, workers=2) == brute_force(matrix, 0)
+        path = parallel_divide_and_conquer(matrix, 1, depth=3, workers=2)
+        assert calculate_path_cost(matrix, path) == calculate_path_cost(matrix, divide_and_conquer(matrix, 1))
+
+
+def test_parallel_backtracking_shared_bound():
+    """Verifica el branch & bound paralelo con cota global compartida y conteo de nodos por worker."""
+    for matrix in [M1, M2, M16, M22, M24]:
+        stats = {}
+        path = parallel_backtracking(matrix, 0, depth=2, workers=2, stats=stats)
+        assert validate_path(matrix, path)
+        assert calculate_path_cost(matrix, path) == calculate_path_cost(matrix, backtracking(matrix, 0))
+        assert stats["nodes_expanded"] == sum(stats["nodes_per_worker"])
+        assert 1 <= len(stats["nodes_per_worker"]) <= 2
+        assert stats["nodes_pruned"] < stats["nodes_expanded"]
+
+
+def test_parallel_in_process_releases_matrix():
+    """Verifica que con workers=1 el estado global del worker se libere al terminar (no retiene la matriz)."""
+    import importlib
+    parallel = importlib.import_module("src.algorithms.parallel")
+    assert parallel_brute_force(M1, 0, workers=1) == brute_force(M1, 0)
+    assert parallel._matrix is None and parallel._suffix_matrix is None
+    parallel_backtracking(M1, 0, workers=1)
+    assert parallel._matrix is None and parallel._bound is None
+
+
+@pytest.mark.parametrize("incumbent", ["greedy", "dp", None])
+def test_backtracking_bounded(incumbent):
+    """Verifica el B&B con cotas inferiores admisibles para cada tipo de incumbente inicial."""
+    for matrix in [M1, M2, M4, M5, M9, M16, M18, M22, M24, M26]:
+        stats = {}
+        path = backtracking_bounded(matrix, 0, incumbent=incumbent, stats=stats)
+        assert validate_path(matrix, path)
+        assert calculate_path_cost(matrix, path) == pytest.approx(
+            calculate_path_cost(matrix, tabulation(matrix, 0)), rel=1e-9)
+        assert stats["nodes_pruned"] <= stats["nodes_expanded"]
+
+    # Con el óptimo de DP como incumbente solo se expande la raíz si la cota ya lo demuestra
+    stats = {}
+    backtracking_bounded(M13, 0, incumbent="dp", stats=stats)
+    assert stats["nodes_expanded"] == 1
+
+    # Sin recursión: más columnas que el límite de recursión de Python
+    wide = [[0] * 1200, [5] * 1200, [5] * 1200]
+    path = backtracking_bounded(wide, 1, incumbent=None)
+    assert validate_path(wide, path) and calculate_path_cost(wide, path) == 5
+
+
+def test_iterative_engines_match_recursive():
+    """Verifica que las versiones iterativas (pila explícita) den exactamente el mismo camino que las recursivas."""
+    import random
+
+    rng = random.Random(11)
+    for _ in range(300):
+        rows, cols = rng.randint(1, 5), rng.randint(1, 8)
+        matrix = [[rng.uniform(-5, 5) for _ in range(cols)] for _ in range(rows)]
+        start = rng.randrange(rows)
+        assert brute_force_iterative(matrix, start) == brute_force(matrix, start)
+        assert backtracking_iterative(matrix, start) == backtracking(matrix, start)
+
+
+def test_best_first_expansions():
+    """Verifica que Dijkstra y A* sean óptimos y que A* expanda menos celdas en superficies suaves."""
+    from src.matrix.presets import get_matrix_by_preset
+
+    for matrix in [M1, M2, M4, M9, M16, M22, M24, M26]:
+        for engine in (dijkstra, astar):
+            stats = {}
+            path = engine(matrix, 0, stats=stats)
+            assert validate_path(matrix, path)
+            assert calculate_path_cost(matrix, path) == pytest.approx(
+                calculate_path_cost(matrix, tabulation(matrix, 0)), rel=1e-9)
+            assert 1 <= stats["nodes_expanded"] <= stats["cells"]
+            assert stats["peak_open_set"] >= 1
+
+    for preset in ["valley_small", "inclined_plane_small", "gaussian_small"]:
+        matrix = get_matrix_by_preset(preset, seed=42)
+        dijkstra_stats, astar_stats = {}, {}
+        dijkstra(matrix, 0, stats=dijkstra_stats)
+        astar(matrix, 0, stats=astar_stats)
+        assert astar_stats["nodes_expanded"] < dijkstra_stats["nodes_expanded"]
+        assert astar_stats["nodes_expanded"] < astar_stats["cells"]
+
+
+def test_incremental_solver():
+    """Verifica que el solver incremental coincida con tabulation tras actualizaciones puntuales."""
+    import random
+
+    rng = random.Random(13)
+    for matrix in [M1, M2, M9, M16, M22, M24, M26]:
+        matrix = [row[:] for row in matrix]
+        solver = IncrementalSolver(matrix)
+        for _ in range(20):
+            row, col = rng.randrange(len(matrix)), rng.randrange(len(matrix[0]))
+            value = rng.randint(-5, 5)
+            matrix[row][col] = value
+            solver.update(row, col, value)
+            start = rng.randrange(len(matrix))
+            assert solver.best_path(start) == tabulation(matrix, start)
+            assert solver.best_cost(start) == calculate_path_cost(matrix, tabulation(matrix, start))
+
+    # Una actualización en la última columna de una matriz constante solo recalcula pocas columnas
+    matrix = [[1] * 200 for _ in range(10)]
+    solver = IncrementalSolver(matrix)
+    solver.update(3, 199, 1)
+    solver.update(3, 100, 0)
+    solver.best_cost(0)
+    assert solver.columns_recomputed < 200 + 110
+
+    assert IncrementalSolver([]).best_path(0) == []
+    with pytest.raises(IndexError):
+        solver.update(10, 0, 1)
+
+
+def test_tropical_segment_tree():
+    """Verifica consultas por rango de columnas y actualizaciones puntuales contra tabulation sobre la submatriz."""
+    import random
+
+    rng = random.Random(14)
+    for matrix in [M1, M2, M5, M9, M16, M22, M24, M26]:
+        matrix = [row[:] for row in matrix]
+        tree = TropicalSegmentTree(matrix)
+        rows, cols = len(matrix), len(matrix[0])
+        for _ in range(15):
+            row, col = rng.randrange(rows), rng.randrange(cols)
+            value = rng.randint(-5, 5)
+            matrix[row][col] = value
+            tree.update(row, col, value)
+
+            a = rng.randrange(cols)
+            b = rng.randrange(a, cols)
+            start = rng.randrange(rows)
+            window = [r[a:b + 1] for r in matrix]
+            assert tree.query(a, b, start) == pytest.approx(
+                calculate_path_cost(window, tabulation(window, start)), rel=1e-9)
+
+    with pytest.raises(IndexError):
+        TropicalSegmentTree(M1).query(2, 1, 0)
+    with pytest.raises(ValueError):
+        TropicalSegmentTree([])
+
+
+def test_parallel_blocks():
+    """Verifica el solver por bloques (matrices de transferencia min-plus) con distintos números de bloques y un pool real."""
+    import random
+
+    rng = random.Random(15)
+    for _ in range(100):
+        rows, cols = rng.randint(1, 6), rng.randint(1, 25)
+        matrix = [[rng.uniform(-5, 5) for _ in range(cols)] for _ in range(rows)]
+        start = rng.randrange(rows)
+        path = parallel_blocks(matrix, start, blocks=rng.randint(1, 8), workers=1)
+        assert validate_path(matrix, path)
+        assert path[0] == [0, start]
+        assert calculate_path_cost(matrix, path) == pytest.approx(
+            calculate_path_cost(matrix, tabulation(matrix, start)), rel=1e-9)
+
+    stats = {}
+    path = parallel_blocks(M24, 1, workers=2, stats=stats)
+    assert calculate_path_cost(M24, path) == calculate_path_cost(M24, tabulation(M24, 1))
+    assert stats["workers"] == 2
+    assert stats["blocks"] == min(8, len(M24[0]))
+
+    # En proceso no queda referenciada la matriz tras la llamada
+    import importlib
+    assert importlib.import_module("src.algorithms.parallel_blocks")._matrix is None
+
+
+def test_threaded_matches_tabulation():
+    """Verifica que la DP con filas repartidas entre hilos dé exactamente los caminos de tabulation."""
+    import random
+
+    rng = random.Random(16)
+    for _ in range(100):
+        rows, cols = rng.randint(1, 9), rng.randint(1, 10)
+        matrix = [[rng.choice([rng.randint(-3, 3), rng.uniform(-3, 3)]) for _ in range(cols)]
+                  for _ in range(rows)]
+        start = rng.randrange(rows)
+        for threads in (1, 2, 3, rows):
+            assert threaded(matrix, start, threads=threads) == tabulation(matrix, start)
+
+    stats = {}
+    threaded(M24, 0, threads=3, stats=stats)
+    assert stats["threads"] == 3
+    assert sum(stats["shard_rows"]) == len(M24)
+    assert len(stats["busy_seconds"]) == len(stats["barrier_wait_seconds"]) == 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,563 @@
+"""
+Unit tests for the benchmark runner.
+"""
+
+import pytest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.benchmark import BenchmarkRunner, RepetitionSettings
+from src.benchmark.repetition import median_confidence_interval, summarize_samples
+
+# Matriz 5x6 de test_algorithms.py (costo óptimo 16 desde la fila 0)
+M1 = [
+    [3, 4, 1, 2, 8, 6],
+    [6, 1, 8, 2, 7, 4],
+    [5, 9, 3, 9, 9, 5],
+    [8, 4, 1, 3, 2, 6],
+    [3, 7, 2, 8, 6, 4]
+]
+
+# 10×40: brute force no termina (3^39 caminos por fila), fuerza timeouts
+M_BIG = [[(row * 7 + col * 3) % 10 for col in range(40)] for row in range(10)]
+
+
+@pytest.mark.parametrize("algo_name", ["tabulation", "backtracking"])
+def test_run_single_all_starts(tmp_path, algo_name):
+    """Verifica que el modo all-starts registre la mejor fila de inicio y su camino."""
+    runner = BenchmarkRunner(algo_name, output_dir=str(tmp_path))
+
+    single = runner.run_single(M1, "M1", start_position=0)
+    result = runner.run_single(M1, "M1", start_position=0, all_starts=True)
+
+    assert result.all_starts and not single.all_starts
+    assert result.error_message is None
+    assert result.path[0] == [0, result.start_position]
+    assert result.path_cost <= single.path_cost
+    assert len(runner.results) == 2
+
+
+def test_algorithm_options(tmp_path):
+    """Verifica que las opciones del algoritmo (intervalo de checkpoints) lleguen al proceso hijo."""
+    runner = BenchmarkRunner(
+        "vectorized_checkpoint",
+        output_dir=str(tmp_path),
+        algorithm_options={"interval": 2}
+    )
+    result = runner.run_single(M1, "M1", start_position=0)
+
+    assert result.error_message is None
+    assert result.path_cost == 16
+
+
+def test_algorithm_stats_recorded(tmp_path):
+    """Verifica que los contadores reportados por el algoritmo (stats) se guarden en el resultado."""
+    runner = BenchmarkRunner(
+        "parallel_backtracking",
+        output_dir=str(tmp_path),
+        algorithm_options={"workers": 2}
+    )
+    result = runner.run_single(M1, "M1", start_position=0)
+
+    assert result.error_message is None
+    assert result.path_cost == 16
+    assert result.algorithm_stats["nodes_expanded"] == sum(result.algorithm_stats["nodes_per_worker"])
+
+    # El CSV no incluye los contadores anidados
+    runner.save(format="csv")
+
+
+def test_warm_workers(tmp_path):
+    """Verifica que el pool persistente reutilice el worker y solo reemplace el que excede el timeout."""
+    runner = BenchmarkRunner("tabulation", output_dir=str(tmp_path), warm_workers=True)
+    try:
+        first = runner.run_single(M1, "M1", start_position=0)
+        worker = runner.worker_pool._idle[0].process.pid
+        second = runner.run_single(M1, "M1", start_position=0, all_starts=True)
+
+        assert first.error_message is None and first.path_cost == 16
+        assert second.error_message is None and second.all_starts
+        assert runner.worker_pool._idle[0].process.pid == worker
+        assert runner.worker_pool.respawns == 0
+    finally:
+        runner.close()
+
+    runner = BenchmarkRunner("brute_force", output_dir=str(tmp_path), warm_workers=True)
+    try:
+        stuck = runner.run_single(M_BIG, "big", start_position=0, timeout=0.5)
+        after = runner.run_single(M1, "M1", start_position=0)
+
+        assert stuck.timed_out and stuck.path == []
+        assert runner.worker_pool.respawns == 1
+        assert after.error_message is None and after.path_cost == 16
+    finally:
+        runner.close()
+
+
+@pytest.mark.parametrize("memory_sample_interval", [None, 0.05])
+def test_large_result_new_process(tmp_path, memory_sample_interval):
+    """Verifica que un resultado mayor que el buffer del pipe no se confunda con un timeout (el padre vacía la cola mientras espera)."""
+    wide = [[(row * 7 + col * 3) % 10 for col in range(20000)] for row in range(10)]
+    runner = BenchmarkRunner("vectorized", output_dir=str(tmp_path),
+                             memory_sample_interval=memory_sample_interval)
+    result = runner.run_single(wide, "wide", start_position=0, timeout=20)
+
+    assert not result.timed_out and result.error_message is None
+    assert len(result.path) == 20000
+    assert result.execution_time_seconds < 20
+
+
+def _live_pids():
+    """PIDs vivos (no zombis) con su proceso padre, leídos de /proc."""
+    pids = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError, ValueError):
+            continue
+        if fields[0] != "Z":
+            pids[int(entry)] = int(fields[1])
+    return pids
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="requiere /proc (Linux)")
+@pytest.mark.parametrize("warm_workers", [False, True])
+def test_timeout_kills_pool_workers(tmp_path, warm_workers):
+    """Verifica que un timeout mate también los workers del ProcessPoolExecutor del algoritmo (sin huérfanos)."""
+    import time
+    before = set(_live_pids())
+    runner = BenchmarkRunner("parallel_brute_force", output_dir=str(tmp_path),
+                             algorithm_options={"workers": 2}, warm_workers=warm_workers)
+    try:
+        assert runner.run_single(M_BIG, "big", start_position=0, timeout=1.0).timed_out
+        time.sleep(0.3)
+        leftover = [pid for pid, ppid in _live_pids().items()
+                    if pid not in before and ppid != os.getpid()]
+        for pid in leftover:
+            os.kill(pid, 9)  # No dejar huérfanos si el test falla
+        assert leftover == []
+    finally:
+        runner.close()
+
+
+@pytest.mark.parametrize("separate_memory_run", [False, True])
+@pytest.mark.parametrize("warm_workers", [False, True])
+def test_child_timing(tmp_path, separate_memory_run, warm_workers):
+    """Verifica que el tiempo del algoritmo medido en el hijo quede separado del overhead de orquestación."""
+    runner = BenchmarkRunner(
+        "memoization",
+        output_dir=str(tmp_path),
+        warm_workers=warm_workers,
+        separate_memory_run=separate_memory_run
+    )
+    try:
+        result = runner.run_single(M1, "M1", start_position=0)
+    finally:
+        runner.close()
+
+    assert result.error_message is None and result.path_cost == 16
+    assert 0 < result.algorithm_wall_seconds < result.execution_time_seconds
+    assert result.algorithm_cpu_seconds >= 0
+    assert result.peak_memory_kb > 0
+    assert result.orchestration_overhead_seconds > 0
+    assert result.orchestration_overhead_seconds <= result.execution_time_seconds - result.algorithm_wall_seconds
+
+    filepath = runner.save(format="csv")
+    with open(filepath, encoding="utf-8") as f:
+        assert "orchestration_overhead_seconds" in f.readline()
+
+
+def test_repetition_statistics():
+    """Verifica el intervalo de confianza de la mediana y el resumen (mediana, IQR, mínimo)."""
+    samples = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert median_confidence_interval(samples) == (1.0, 5.0)
+    lower, upper = median_confidence_interval(list(range(100)))
+    assert lower < 49.5 < upper and upper - lower < 30
+
+    summary = summarize_samples(samples)
+    assert summary["median_seconds"] == 3.0
+    assert summary["min_seconds"] == 1.0
+    assert summary["sample_count"] == 5
+    assert summary["iqr_seconds"] > 0
+    assert summarize_samples([2.0])["iqr_seconds"] == 0.0
+
+
+def test_run_repeated(tmp_path):
+    """Verifica el modo de repeticiones: warm-up, muestras intercaladas y errores que terminan el trabajo."""
+    settings = RepetitionSettings(warmup=2, min_samples=3, max_samples=8, job_budget_seconds=20)
+    runner = BenchmarkRunner("tabulation", output_dir=str(tmp_path), repetition=settings)
+    assert runner.warm_workers  # El warm-up solo sirve en un worker persistente
+    try:
+        results = runner.run_repeated([
+            (M1, "M1", 0),
+            (M1, "M1_bad", 99),
+        ])
+        assert runner._worker_pool is not None
+    finally:
+        runner.close()
+
+    good, bad = results
+    assert good.error_message is None and good.path_cost == 16
+    assert good.peak_memory_kb is not None
+    assert settings.min_samples <= good.sample_count <= settings.max_samples
+    assert len(good.samples) == good.sample_count
+    assert good.execution_time_seconds == good.median_seconds
+    assert good.min_seconds == min(good.samples)
+
+    assert bad.error_message and bad.sample_count is None
+    # Se registran (y se escriben al journal) en el orden en que terminan
+    assert runner.results == [bad, good]
+
+    filepath = runner.save(format="csv")
+    with open(filepath, encoding="utf-8") as f:
+        assert "sample_count" in f.readline()
+
+
+def test_autorange(tmp_path):
+    """Verifica el modo autorange en proceso: tiempo por llamada, bucle de varias llamadas y timeout por SIGALRM."""
+    runner = BenchmarkRunner("tabulation", output_dir=str(tmp_path), autorange=True,
+                             autorange_min_seconds=0.05)
+    result = runner.run_single(M1, "M1", start_position=0)
+
+    assert result.error_message is None and result.path_cost == 16
+    assert result.autorange_loops > 1
+    assert result.execution_time_seconds == result.algorithm_wall_seconds
+    assert result.execution_time_seconds * result.autorange_loops >= 0.05
+    assert result.peak_memory_kb > 0
+
+    slow = BenchmarkRunner("brute_force", output_dir=str(tmp_path), autorange=True)
+    result = slow.run_single(M_BIG, "big", start_position=0, timeout=0.3)
+    assert result.timed_out and result.path == []
+
+    bad = runner.run_single(M1, "M1", start_position=99)
+    assert bad.error_message and not bad.timed_out
+
+
+def test_autorange_watchdog():
+    """Verifica que fuera del hilo principal el timeout lo marque un hilo vigilante entre llamadas."""
+    import threading
+    from src.algorithms import tabulation
+    from src.benchmark.runner import autorange_algorithm, AutorangeTimeout
+
+    outcome = {}
+
+    def measure():
+        try:
+            autorange_algorithm(tabulation, M1, 0, min_seconds=60, timeout=0.2)
+        except AutorangeTimeout:
+            outcome["timed_out"] = True
+
+    thread = threading.Thread(target=measure)
+    thread.start()
+    thread.join(timeout=10)
+    assert outcome.get("timed_out")
+
+
+def test_autorange_rejects_process_pools(tmp_path):
+    """Verifica que autorange rechace los motores con pool de procesos, cuyo timeout no se puede aplicar."""
+    with pytest.raises(ValueError, match="process pool"):
+        BenchmarkRunner("parallel_brute_force", output_dir=str(tmp_path), autorange=True)
+
+    # Con workers=1 el motor corre en el mismo proceso y sí se puede medir
+    runner = BenchmarkRunner("parallel_blocks", output_dir=str(tmp_path), autorange=True,
+                             algorithm_options={"workers": 1}, autorange_min_seconds=0.01)
+    result = runner.run_single(M1, "M1", start_position=0, timeout=5)
+    assert result.error_message is None and result.path_cost == 16
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="requiere /proc (Linux)")
+@pytest.mark.parametrize("warm_workers", [False, True])
+def test_resource_usage(tmp_path, warm_workers):
+    """Verifica que se registren RSS pico, tiempos de CPU y cambios de contexto, también tras un timeout."""
+    runner = BenchmarkRunner("vectorized", output_dir=str(tmp_path), warm_workers=warm_workers)
+    slow = BenchmarkRunner("brute_force", output_dir=str(tmp_path), warm_workers=warm_workers)
+    try:
+        result = runner.run_single(M1, "M1", start_position=0)
+        stuck = slow.run_single(M_BIG, "big", start_position=0, timeout=0.5)
+    finally:
+        runner.close()
+        slow.close()
+
+    assert result.error_message is None and result.path_cost == 16
+    assert result.peak_rss_kb > 0
+    assert result.user_cpu_seconds >= 0 and result.system_cpu_seconds >= 0
+    assert result.voluntary_ctx_switches >= 0 and result.involuntary_ctx_switches >= 0
+
+    assert stuck.timed_out
+    assert stuck.peak_rss_kb > 0
+    assert stuck.user_cpu_seconds is None
+    # Solo un proceso creado para el trabajo reporta el pico de sus hijos
+    assert (result.children_peak_rss_kb is None) == warm_workers
+
+
+def _allocate_mb(size_mb):
+    """Reserva y toca size_mb MB en el proceso hijo."""
+    block = bytearray(size_mb * 1024 * 1024)
+    block[::4096] = b"x" * len(block[::4096])
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="requiere /proc (Linux)")
+def test_peak_rss_excludes_children():
+    """Verifica que el pico de un hijo ya terminado no se cuele en el RSS pico del proceso (worker persistente)."""
+    from multiprocessing import Process
+    from src.benchmark.resources import children_peak_rss_kb, peak_rss_kb
+
+    child = Process(target=_allocate_mb, args=(300,))
+    child.start()
+    child.join()
+    assert children_peak_rss_kb() > 300 * 1024
+    assert peak_rss_kb() < children_peak_rss_kb() - 200 * 1024
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="requiere /proc (Linux)")
+@pytest.mark.parametrize("warm_workers", [False, True])
+def test_memory_timeline(tmp_path, warm_workers):
+    """Verifica que el padre muestree el RSS del hijo mientras espera, también si hay timeout."""
+    runner = BenchmarkRunner("brute_force", output_dir=str(tmp_path),
+                             warm_workers=warm_workers, memory_sample_interval=0.02)
+    try:
+        stuck = runner.run_single(M_BIG, "big", start_position=0, timeout=0.3)
+        result = runner.run_single(M1, "M1", start_position=0)
+    finally:
+        runner.close()
+
+    assert stuck.timed_out
+    assert len(stuck.memory_timeline) >= 5
+    times = [t for t, _ in stuck.memory_timeline]
+    assert times == sorted(times) and times[-1] < 0.3 + 0.1
+    assert all(rss > 0 for _, rss in stuck.memory_timeline)
+
+    assert result.error_message is None
+    assert len(result.memory_timeline) >= 1
+
+    filepath = runner.save(format="csv")
+    with open(filepath, encoding="utf-8") as f:
+        assert "memory_timeline" not in f.readline()
+
+
+def test_journal_resume(tmp_path):
+    """Verifica el journal JSONL: cada resultado se escribe al instante, --resume salta trabajos hechos y save() compacta."""
+    from src.benchmark import ResultJournal
+
+    runner = BenchmarkRunner("tabulation", output_dir=str(tmp_path))
+    first = runner.run_single(M1, "M1", start_position=0)
+    runner.run_single(M1, "M1", start_position=2)
+    runner.run_single(M1, "M1", start_position=0, all_starts=True)
+    journal_path = runner.journal.path
+    assert len(ResultJournal(journal_path).load()) == 3
+
+    # Simular una escritura cortada por un crash
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write('{"algorithm": "tabul')
+
+    resumed = BenchmarkRunner("tabulation", output_dir=str(tmp_path), resume=True)
+    assert len(resumed.results) == 3
+    assert resumed.is_completed("M1", 0) and resumed.is_completed("M1", 0, all_starts=True)
+    assert not resumed.is_completed("M1", 1)
+
+    again = resumed.run_single(M1, "M1", start_position=0)
+    assert again.timestamp == first.timestamp and again.path == first.path
+    resumed.run_single(M1, "M1", start_position=1)
+    assert len(resumed.results) == 4
+    # El resultado nuevo no quedó pegado al fragmento cortado
+    assert len(ResultJournal(journal_path).load()) == 4
+
+    # Tampoco si se añade sin cargar antes
+    torn = ResultJournal(str(tmp_path / "torn.jsonl"))
+    torn.append(first)
+    with open(torn.path, "a", encoding="utf-8") as f:
+        f.write('{"algorithm": "tabul')
+    ResultJournal(torn.path).append(first)
+    assert len(ResultJournal(torn.path).load()) == 2
+
+    filepath = resumed.save(format="json")
+    assert not os.path.exists(journal_path)
+    from src.benchmark import load_results
+    assert len(load_results(filepath)) == 4
+
+    # Sin --resume el journal anterior se aparta (.bak), nunca se borra
+    resumed.run_single(M1, "M1", start_position=3)
+    fresh = BenchmarkRunner("tabulation", output_dir=str(tmp_path))
+    assert fresh.results == [] and not os.path.exists(journal_path)
+    assert fresh.rotated_journal == journal_path + ".bak"
+    assert len(ResultJournal(fresh.rotated_journal).load()) == 1
+    fresh.run_single(M1, "M1", start_position=4)
+    again = BenchmarkRunner("tabulation", output_dir=str(tmp_path))
+    assert again.rotated_journal == journal_path + ".1.bak"
+    assert len(ResultJournal(journal_path + ".bak").load()) == 1
+
+
+def test_complexity_cutoff(tmp_path, monkeypatch):
+    """Verifica que los tamaños se ejecutan en orden creciente y que tras un timeout los mayores se marcan como timeout previsto."""
+    monkeypatch.setattr("src.benchmark.runner.get_adaptive_timeout", lambda size: 0.3)
+    runner = BenchmarkRunner("brute_force", output_dir=str(tmp_path))
+    results = runner.run_complexity_analysis(sizes=[20, 5, 30], seeds=[1, 2])
+
+    assert [r.matrix_rows for r in results] == [5, 5, 20, 20, 30, 30]
+    assert all(not r.timed_out and not r.skipped for r in results[:2])
+    # Los dos de 20×20 se ejecutan de verdad (misma talla, otra semilla)
+    assert all(r.timed_out and not r.skipped for r in results[2:4])
+    for r in results[4:]:
+        assert r.timed_out and r.skipped and r.skip_reason == "predicted_timeout"
+        assert r.execution_time_seconds == 0.0
+
+    # Los omitidos no van al journal: al reanudar se vuelve a decidir
+    resumed = BenchmarkRunner("brute_force", output_dir=str(tmp_path), resume=True)
+    assert len(resumed.results) == 4
+    again = resumed.run_complexity_analysis(sizes=[5, 20, 30], seeds=[1, 2])
+    assert [r.skip_reason for r in again[4:]] == ["predicted_timeout"] * 2
+
+
+def test_time_budget(tmp_path, monkeypatch):
+    """Verifica el presupuesto global: solo se lanza un trabajo si su timeout adaptativo cabe en el tiempo restante."""
+    monkeypatch.setattr("src.benchmark.runner.get_adaptive_timeout",
+                        lambda size: 60.0 if size <= 5 else 1000.0)
+    runner = BenchmarkRunner("tabulation", output_dir=str(tmp_path), time_budget_seconds=100.0)
+    assert 99.0 < runner.remaining_budget() <= 100.0
+    results = runner.run_complexity_analysis(sizes=[5, 7], seeds=[1])
+
+    assert not results[0].skipped and results[0].path
+    assert results[1].skipped and results[1].skip_reason == "budget"
+    assert not results[1].timed_out  # No es un timeout: simplemente no se ejecutó
+
+    skipped = runner.run_single(M1, "M1", start_position=0, timeout=200.0)
+    assert skipped.skipped and skipped.skip_reason == "budget"
+    assert "skipped" in skipped.to_dict() and "skip_reason" in skipped.to_dict()
+
+    # En modo repetición tampoco se empieza ninguna ejecución sin presupuesto
+    repeated = BenchmarkRunner("tabulation", output_dir=str(tmp_path),
+                               repetition=RepetitionSettings(), time_budget_seconds=1.0)
+    assert all(r.skipped for r in repeated.run_repeated([(M1, "M1", 0), (M1, "M1", 1)]))
+
+
+def _observed(algorithm, size, seconds, timed_out=False):
+    """Resultado sintético para alimentar el modelo de tiempos."""
+    from src.benchmark import BenchmarkResult
+    return BenchmarkResult(algorithm, f"square_{size}", size, size, 0, seconds, [], 0.0, "t",
+                           timed_out=timed_out)
+
+
+def test_runtime_model_fit(tmp_path):
+    """Verifica el ajuste exponencial (exhaustivos) y potencial (DP), los límites por timeout y la persistencia."""
+    import math
+    from src.benchmark import RuntimeModels
+    from src.benchmark.prediction import (
+        fit_log_linear, model_family, MIN_TIMEOUT_SECONDS, MAX_TIMEOUT_SECONDS
+    )
+
+    intercept, slope = fit_log_linear([(c, 1e-4 * 3 ** c) for c in range(4, 10)])
+    assert slope == pytest.approx(math.log(3)) and intercept == pytest.approx(math.log(1e-4))
+    assert fit_log_linear([(5, 1.0), (5, 2.0)]) is None
+    assert model_family("brute_force") == "exponential" and model_family("tabulation") == "power"
+
+    path = str(tmp_path / "models.json")
+    models = RuntimeModels(path)
+    assert models.predict("brute_force", 10, 10) is None
+    for size in (6, 7, 8):
+        assert models.observe(_observed("brute_force", size, 1e-4 * 3 ** size))
+        assert models.observe(_observed("tabulation", size, 1e-6 * (size * size) ** 2))
+    assert models.predict("brute_force", 10, 10) == pytest.approx(1e-4 * 3 ** 10)
+    assert models.predict("tabulation", 16, 16) == pytest.approx(1e-6 * 256 ** 2)
+    assert models.timeout_for("brute_force", 6, 6) == MIN_TIMEOUT_SECONDS
+    assert models.timeout_for("brute_force", 14, 14) == MAX_TIMEOUT_SECONDS
+    assert not models.out_of_reach("brute_force", 12, 12)  # ~53s
+    assert models.out_of_reach("brute_force", 20, 20)
+
+    # Un timeout es cota inferior para ese tamaño y los mayores, no para los menores
+    models.observe(_observed("brute_force", 9, 100.0, timed_out=True))
+    assert models.predict("brute_force", 10, 10) == 100.0
+    assert models.predict("brute_force", 8, 8) < 1.0
+    assert not models.observe(_observed("tabulation", 5, 0.0))  # Omitido/sin tiempo
+
+    models.save()
+    reloaded = RuntimeModels(path)
+    assert reloaded.predict("brute_force", 10, 10) == models.predict("brute_force", 10, 10)
+    assert reloaded.fit("tabulation") == models.fit("tabulation")
+
+
+def test_runtime_model_runner(tmp_path, capsys):
+    """Verifica que el runner refina el modelo con cada corrida y lo usa para timeouts, ETA y omisiones."""
+    from src.benchmark.prediction import MIN_TIMEOUT_SECONDS
+
+    path = str(tmp_path / "models.json")
+    runner = BenchmarkRunner("tabulation", output_dir=str(tmp_path), runtime_models_path=path)
+    assert runner.estimate_seconds([(5, 5)]) == (0.0, 1)
+    results = runner.run_complexity_analysis(sizes=[5, 10], seeds=[1])
+    assert results[0].predicted_seconds is None and results[1].predicted_seconds is None
+    assert os.path.exists(path)
+
+    again = BenchmarkRunner("tabulation", output_dir=str(tmp_path), runtime_models_path=path)
+    assert again._timeout_for(M1, None, True) == MIN_TIMEOUT_SECONDS  # No el escalón de 60s
+    assert again._timeout_for(M1, None, True, all_starts=True) == 60.0
+    seconds, unknown = again.estimate_seconds([(20, 20), (30, 30)])
+    assert seconds > 0 and unknown == 0
+    result = again.run_single(M1, "M1", start_position=0)
+    assert result.predicted_seconds > 0
+    assert len(again.runtime_models.observations["tabulation"]) == 3
+
+    # brute_force: el modelo predice años para 10×40 y el trabajo se omite sin ejecutarse
+    brute = BenchmarkRunner("brute_force", output_dir=str(tmp_path), runtime_models_path=path)
+    for size in (6, 7, 8):
+        brute.runtime_models.observe(_observed("brute_force", size, 1e-4 * 3 ** size))
+    skipped = brute.run_single(M_BIG, "big", start_position=0)
+    assert skipped.skipped and skipped.skip_reason == "predicted_timeout" and skipped.timed_out
+    capsys.readouterr()
+    brute.run_complexity_analysis(sizes=[40], seeds=[1])
+    assert "OMITIDO (timeout previsto por el modelo)" in capsys.readouterr().out
+    # Con un timeout explícito el usuario manda: se ejecuta
+    assert not brute.run_single(M1, "M1", start_position=0, timeout=5.0).skipped
+
+
+def test_runtime_model_fits_algorithm_time(tmp_path):
+    """Verifica que el modelo ajuste el tiempo del algoritmo (sin el arranque del proceso) y que al extrapolar el timeout no baje del escalón adaptativo."""
+    runner = BenchmarkRunner("brute_force", output_dir=str(tmp_path),
+                             runtime_models_path=str(tmp_path / "models.json"))
+    for size in range(5, 14):
+        seconds = 4e-7 * 3 ** size
+        result = _observed("brute_force", size, seconds + 0.03)  # ~30ms de arranque
+        result.algorithm_wall_seconds = seconds
+        runner.runtime_models.observe(result)
+
+    assert runner.runtime_models.predict("brute_force", 18, 18) == pytest.approx(4e-7 * 3 ** 18)
+    assert runner._out_of_reach([[1] * 30] * 30, False)
+    # 6×6 está cubierto por corridas completadas: vale el mínimo del modelo
+    assert runner._timeout_for([[1] * 6] * 6, None, True) == 10.0
+    # Más allá del mayor tamaño completado no se baja del escalón (120s para 14×14)
+    assert runner._timeout_for([[1] * 14] * 14, None, True) == 120.0
+
+
+def test_runtime_model_cutoff_and_modes(tmp_path, monkeypatch):
+    """Verifica que un timeout con límite del modelo (menor que el escalón adaptativo) no dispare el corte, y que cada modo de medición tenga su modelo."""
+    from src.benchmark import RuntimeModels
+    monkeypatch.setattr("src.benchmark.prediction.MIN_TIMEOUT_SECONDS", 0.3)
+    monkeypatch.setattr("src.benchmark.prediction.MAX_TIMEOUT_SECONDS", 0.3)
+    path = str(tmp_path / "models.json")
+
+    runner = BenchmarkRunner("brute_force", output_dir=str(tmp_path), runtime_models_path=path)
+    assert runner.measurement_mode == "new_process"
+    for size in (3, 4, 20):  # Modelo que subestima mucho: ~0.04s para 16×16
+        runner.runtime_models.observe(_observed("brute_force", size, 1e-9 * 3 ** size))
+    results = runner.run_complexity_analysis(sizes=[16, 18], seeds=[1])
+
+    assert [r.timeout_seconds for r in results] == [0.3, 0.3]
+    assert all(r.timed_out and not r.skipped for r in results)  # 18×18 sí se ejecutó
+
+    # Los tiempos por llamada de autorange no se mezclan con los de proceso
+    autorange = RuntimeModels(path, "autorange")
+    assert autorange.predict("brute_force", 16, 16) is None
+    autorange.observe(_observed("brute_force", 5, 1e-4))
+    autorange.save()
+    assert len(RuntimeModels(path).observations["brute_force"]) == 5
+    assert RuntimeModels(path, "autorange").observations["brute_force"] == [[5, 5, 1e-4, False]]
+    with pytest.raises(ValueError):
+        RuntimeModels(path, "otro")
+
+    repeated = BenchmarkRunner("tabulation", output_dir=str(tmp_path), runtime_models_path=path,
+                               repetition=RepetitionSettings(), warm_workers=True)
+    assert repeated.runtime_models.mode == "repeated"